@@ -1,110 +1,1394 @@
 import os
 import json
 import csv
+import datetime
+import io
+import codecs
+import hashlib
+import importlib
+import mmap
+import pickle
+import time
+import types
+import re
+import shutil
+import tempfile
+import threading
+import zipfile
+import zlib
+from array import array
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from contextlib import contextmanager
+from itertools import islice
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable, Iterator
 import mimetypes
 
-# Import library untuk berbagai format dokumen
-try:
-    from docx import Document
-    from docx.shared import Inches
-except ImportError:
-    print("Install python-docx: pip install python-docx")
 
-try:
-    import openpyxl
-    from openpyxl import Workbook
-except ImportError:
-    print("Install openpyxl: pip install openpyxl")
+class _LazyImport:
+    """Proxy modul atau atribut library pihak ketiga yang baru diimport saat pertama dipakai
+    
+    Import app tidak lagi memuat python-docx, openpyxl dan PyPDF2; library
+    hanya dimuat oleh format yang benar-benar dipakai. Jika library belum
+    terpasang, pemakaian pertama menghasilkan ImportError berisi petunjuk install.
+    """
+    
+    def __init__(self, module: str, attribute: Optional[str] = None, package: Optional[str] = None):
+        self._module = module
+        self._attribute = attribute
+        self._package = package or module.split('.')[0]
+        self._target = None
+    
+    def _load(self) -> Any:
+        if self._target is None:
+            try:
+                target = importlib.import_module(self._module)
+            except ImportError:
+                raise ImportError(f"Install {self._package}: pip install {self._package}") from None
+            self._target = getattr(target, self._attribute) if self._attribute else target
+        return self._target
+    
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self._load(), name)
+    
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._load()(*args, **kwargs)
 
-try:
-    from PyPDF2 import PdfReader, PdfWriter
-except ImportError:
-    print("Install PyPDF2: pip install PyPDF2")
+
+# Library untuk berbagai format dokumen, dimuat saat pertama dipakai
+Document = _LazyImport('docx', 'Document', 'python-docx')
+Inches = _LazyImport('docx.shared', 'Inches', 'python-docx')
+openpyxl = _LazyImport('openpyxl')
+Workbook = _LazyImport('openpyxl', 'Workbook')
+column_index_from_string = _LazyImport('openpyxl.utils', 'column_index_from_string')
+get_column_letter = _LazyImport('openpyxl.utils', 'get_column_letter')
+range_boundaries = _LazyImport('openpyxl.utils', 'range_boundaries')
+PdfReader = _LazyImport('PyPDF2', 'PdfReader')
+PdfWriter = _LazyImport('PyPDF2', 'PdfWriter')
 
 try:
     import xml.etree.ElementTree as ET
 except ImportError:
     pass
 
+
+def _xml_escape(text: str) -> str:
+    """Escape &, < dan > untuk teks element XML (seperti xml.sax.saxutils.escape, tanpa import urllib)"""
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+# Handler format bawaan: ekstensi -> nama method di DocumentProcessor
+FORMAT_HANDLERS = {
+    '.txt': '_process_text',
+    '.docx': '_process_docx',
+    '.xlsx': '_process_excel',
+    '.csv': '_process_csv',
+    '.json': '_process_json',
+    '.jsonl': '_process_jsonl',
+    '.xml': '_process_xml',
+    '.pdf': '_process_pdf',
+}
+
+# Grup entry point untuk paket yang menambahkan format baru
+ENTRY_POINT_GROUP = 'down_check.formats'
+
+_registered_formats = {}
+_entry_point_formats = None
+
+
+def register_format(extension: str, handler: Any):
+    """Mendaftarkan handler format tambahan tanpa mengubah DocumentProcessor
+    
+    handler dipanggil sebagai handler(processor, file_path, operation, **kwargs),
+    atau berupa string "modul:fungsi" yang baru diimport saat format dipakai.
+    Paket lain dapat mendaftarkan format yang sama lewat entry point grup
+    ENTRY_POINT_GROUP, dengan nama entry point berupa ekstensi (misalnya "rtf").
+    """
+    extension = extension.lower()
+    if not extension.startswith('.'):
+        extension = '.' + extension
+    _registered_formats[extension] = handler
+
+
+def _discover_entry_points() -> Dict[str, Any]:
+    """Membaca entry point format tambahan sekali saja; modul plugin belum diimport"""
+    global _entry_point_formats
+    if _entry_point_formats is None:
+        found = {}
+        try:
+            from importlib.metadata import entry_points
+        except ImportError:
+            entry_points = None
+        if entry_points is not None:
+            discovered = entry_points()
+            if hasattr(discovered, 'select'):
+                discovered = discovered.select(group=ENTRY_POINT_GROUP)
+            else:
+                discovered = discovered.get(ENTRY_POINT_GROUP, [])
+            for entry_point in discovered:
+                extension = entry_point.name.lower()
+                found[extension if extension.startswith('.') else '.' + extension] = entry_point
+        _entry_point_formats = found
+    return _entry_point_formats
+
+
+class FormatRegistry(Mapping):
+    """Peta ekstensi -> handler format yang di-resolve saat pertama dipakai
+    
+    Urutan prioritas: register_format(), handler bawaan, lalu entry point.
+    Entry point hanya dibaca jika ekstensi tidak dikenal atau daftar format diminta.
+    """
+    
+    def __init__(self, processor: 'DocumentProcessor'):
+        self._processor = processor
+        self._handlers = {}
+    
+    def _spec(self, extension: str) -> Any:
+        spec = _registered_formats.get(extension) or FORMAT_HANDLERS.get(extension)
+        if spec is None:
+            spec = _discover_entry_points().get(extension)
+        return spec
+    
+    def __getitem__(self, extension: str):
+        spec = self._spec(extension)
+        if spec is None:
+            raise KeyError(extension)
+        cached = self._handlers.get(extension)
+        if cached is not None and cached[0] is spec:
+            return cached[1]
+        
+        if isinstance(spec, str) and ':' not in spec:
+            handler = getattr(self._processor, spec)
+        else:
+            if isinstance(spec, str):
+                module, _, attribute = spec.partition(':')
+                target = getattr(importlib.import_module(module), attribute)
+            elif hasattr(spec, 'load'):
+                target = spec.load()
+            else:
+                target = spec
+            handler = partial(target, self._processor)
+        self._handlers[extension] = (spec, handler)
+        return handler
+    
+    def __contains__(self, extension: object) -> bool:
+        return isinstance(extension, str) and self._spec(extension) is not None
+    
+    def __iter__(self) -> Iterator[str]:
+        extensions = dict.fromkeys(FORMAT_HANDLERS)
+        extensions.update(dict.fromkeys(_registered_formats))
+        extensions.update(dict.fromkeys(_discover_entry_points()))
+        return iter(extensions)
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+# Format yang parsing-nya berat di CPU, dikirim ke process pool pada process_batch
+CPU_BOUND_FORMATS = {'.pdf', '.docx', '.xlsx'}
+
+# Format biner yang isinya harus cocok dengan ekstensi; format teks boleh saling tertukar
+BINARY_FORMATS = {'.docx', '.xlsx', '.pdf'}
+
+# Operasi yang hanya membaca file (tidak membuang cache)
+READ_OPERATIONS = {'read', 'iter_rows', 'iter_pages', 'iter', 'query', 'tail', 'read_lines', 'index_lines',
+                   'iter_blocks'}
+
+# Operasi lazy yang mengembalikan iterator, bukan hasil jadi
+LAZY_OPERATIONS = {'iter_rows', 'iter_pages', 'iter', 'iter_blocks'}
+
+# Pola byte untuk memindai JSON tanpa mem-parse seluruh dokumen
+_JSON_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"')
+_JSON_STRUCTURE = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}]')
+_JSON_WHITESPACE = re.compile(rb'[ \t\r\n]*')
+_JSON_SCALAR = re.compile(rb'[^,\]}\s]+')
+
+# XPath sederhana yang bisa dijawab secara streaming: "a/b/c" (relatif root) atau ".//tag"
+# (segmen "." dan ".." tidak termasuk, misalnya xpath default "." yang berarti root)
+_XML_SEGMENT = r'(?!\.\.?(?:/|$))[\w.\-]+'
+_XML_SIMPLE_PATH = re.compile(rf'(?:\./)?({_XML_SEGMENT}(?:/{_XML_SEGMENT})*)')
+_XML_DESCENDANT_TAG = re.compile(rf'\.//({_XML_SEGMENT})')
+
+# Namespace WordprocessingML untuk membaca part .docx langsung dari zip
+_WORD_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_MC_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+_PACKAGE_RELS_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+
+class _EntryTooLarge(Exception):
+    """Hasil serialisasi melewati batas ukuran entri cache"""
+
+
+class _CappedBuffer(io.BytesIO):
+    """BytesIO yang menolak ditulis melewati limit byte"""
+    
+    def __init__(self, limit: int):
+        super().__init__()
+        self.limit = limit
+    
+    def write(self, data) -> int:
+        if self.tell() + memoryview(data).nbytes > self.limit:
+            raise _EntryTooLarge()
+        return super().write(data)
+
+
+class ReadCache:
+    """Cache hasil operasi read, dikunci dengan path + ukuran + mtime file
+    
+    Tier memori berupa LRU dengan batas byte, tier disk (opsional) menyimpan
+    hasil ekstraksi sebagai pickle terkompresi di dalam disk_dir.
+    """
+    
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, disk_dir: Optional[str] = None):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self._entries = OrderedDict()
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+        
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+    
+    def make_key(self, file_path: str, **kwargs) -> Optional[tuple]:
+        """Membuat key cache dari path absolut, ukuran, mtime dan argumen read"""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns, repr(sorted(kwargs.items())))
+    
+    def get(self, key: tuple) -> Any:
+        """Mengambil nilai dari cache, mengembalikan None jika tidak ada"""
+        with self._lock:
+            blob = self._entries.get(key)
+            if blob is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return pickle.loads(blob)
+        
+        blob = self._read_disk(key)
+        with self._lock:
+            if blob is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._store_memory(key, blob)
+        return pickle.loads(blob)
+    
+    def put(self, key: tuple, value: Any):
+        """Menyimpan nilai ke tier memori dan tier disk
+        
+        Tanpa tier disk, serialisasi dihentikan begitu ukurannya melewati
+        max_bytes, sehingga hasil yang tidak mungkin disimpan tidak disalin penuh.
+        """
+        buffer = io.BytesIO() if self.disk_dir else _CappedBuffer(self.max_bytes)
+        try:
+            pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(value)
+        except (pickle.PicklingError, TypeError, AttributeError, _EntryTooLarge):
+            return
+        blob = buffer.getvalue()
+        
+        with self._lock:
+            self._store_memory(key, blob)
+        self._write_disk(key, blob)
+    
+    def invalidate(self, file_path: str):
+        """Menghapus semua entri cache milik file tertentu"""
+        abs_path = os.path.abspath(file_path)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == abs_path]:
+                self._current_bytes -= len(self._entries.pop(key))
+        
+        if self.disk_dir:
+            shutil.rmtree(os.path.join(self.disk_dir, self._path_digest(abs_path)), ignore_errors=True)
+    
+    def clear(self):
+        """Mengosongkan seluruh isi cache"""
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+        
+        if self.disk_dir:
+            shutil.rmtree(self.disk_dir, ignore_errors=True)
+            os.makedirs(self.disk_dir, exist_ok=True)
+    
+    def stats(self) -> Dict[str, int]:
+        """Mengembalikan statistik hit/miss/eviction cache"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'disk_hits': self.disk_hits,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._current_bytes
+            }
+    
+    def _store_memory(self, key: tuple, blob: bytes):
+        """Menyimpan blob ke LRU memori lalu membuang entri lama jika melebihi batas"""
+        if len(blob) > self.max_bytes:
+            return
+        
+        if key in self._entries:
+            self._current_bytes -= len(self._entries.pop(key))
+        self._entries[key] = blob
+        self._current_bytes += len(blob)
+        
+        while self._current_bytes > self.max_bytes:
+            _, old_blob = self._entries.popitem(last=False)
+            self._current_bytes -= len(old_blob)
+            self.evictions += 1
+    
+    def _path_digest(self, abs_path: str) -> str:
+        return hashlib.sha1(abs_path.encode('utf-8')).hexdigest()[:16]
+    
+    def _disk_file(self, key: tuple) -> str:
+        key_digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.disk_dir, self._path_digest(key[0]), key_digest + '.pkl.z')
+    
+    def _read_disk(self, key: tuple) -> Optional[bytes]:
+        if not self.disk_dir:
+            return None
+        try:
+            with open(self._disk_file(key), 'rb') as file:
+                return zlib.decompress(file.read())
+        except (OSError, zlib.error):
+            return None
+    
+    def _write_disk(self, key: tuple, blob: bytes):
+        if not self.disk_dir:
+            return
+        target = self._disk_file(key)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        temp_file = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_file, 'wb') as file:
+            file.write(zlib.compress(blob, 1))
+        os.replace(temp_file, target)
+
+
+class MetricsRegistry:
+    """Registry metrik in-process: jumlah panggilan, error, histogram latensi dan ukuran file per format/operasi
+    
+    file_bytes adalah total ukuran file yang disentuh setiap panggilan (ukuran
+    sesudah operasi), bukan jumlah byte yang benar-benar dibaca: operasi parsial
+    seperti tail atau query hanya membaca sebagian kecil file tersebut.
+    """
+    
+    # Batas atas bucket histogram latensi (detik), bucket terakhir menampung sisanya
+    LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, float('inf'))
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._series = {}
+    
+    def record(self, doc_type: str, operation: str, duration: float, error: bool = False,
+               file_bytes: int = 0):
+        """Mencatat satu panggilan handler"""
+        with self._lock:
+            series = self._series.get((doc_type, operation))
+            if series is None:
+                series = self._series[(doc_type, operation)] = {
+                    'calls': 0, 'errors': 0, 'total_s': 0.0, 'max_s': 0.0,
+                    'file_bytes': 0,
+                    'buckets': [0] * len(self.LATENCY_BUCKETS)
+                }
+            series['calls'] += 1
+            series['errors'] += int(error)
+            series['total_s'] += duration
+            series['max_s'] = max(series['max_s'], duration)
+            series['file_bytes'] += file_bytes
+            for i, bound in enumerate(self.LATENCY_BUCKETS):
+                if duration <= bound:
+                    series['buckets'][i] += 1
+                    break
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Mengembalikan salinan semua metrik dengan key "format.operasi" """
+        with self._lock:
+            result = {}
+            for (doc_type, operation), series in self._series.items():
+                data = dict(series)
+                data['buckets'] = dict(zip(self.LATENCY_BUCKETS, series['buckets']))
+                data['mean_s'] = series['total_s'] / series['calls'] if series['calls'] else 0.0
+                result[f"{doc_type.lstrip('.')}.{operation}"] = data
+            return result
+    
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+
+
+# Registry bawaan yang dipakai bersama oleh semua DocumentProcessor
+metrics_registry = MetricsRegistry()
+
+
 class DocumentProcessor:
     """Kelas utama untuk memproses berbagai jenis dokumen"""
     
-    def __init__(self):
-        self.supported_formats = {
-            '.txt': self._process_text,
-            '.docx': self._process_docx,
-            '.xlsx': self._process_excel,
-            '.csv': self._process_csv,
-            '.json': self._process_json,
-            '.xml': self._process_xml,
-            '.pdf': self._process_pdf
-        }
+    def __init__(self, cache: Optional[ReadCache] = None, verbose: bool = True,
+                 metrics: Optional[MetricsRegistry] = None):
+        self.cache = cache
+        self.verbose = verbose
+        self.metrics = metrics if metrics is not None else metrics_registry
+        self._hooks = []
+        self._line_indexes = {}
+        self._type_cache = OrderedDict()
+        self._type_cache_size = 10000
+        self.supported_formats = FormatRegistry(self)
     
-    def detect_document_type(self, file_path: str) -> str:
-        """Mendeteksi tipe dokumen berdasarkan ekstensi dan MIME type"""
-        if not os.path.exists(file_path):
+    def detect_document_type(self, file_path: str, check_content: bool = True) -> str:
+        """Mendeteksi tipe dokumen berdasarkan ekstensi dan isi awal file (magic number)
+        
+        Hasil sniffing disimpan per file dan dipakai ulang selama ukuran dan mtime
+        tidak berubah. File biner (docx/xlsx/pdf) yang isinya tidak cocok dengan
+        ekstensinya langsung ditolak dengan ValueError. Jika ekstensi tidak
+        dikenal, tipe hasil sniffing yang dipakai.
+        """
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
             raise FileNotFoundError(f"File {file_path} tidak ditemukan")
         
         # Deteksi berdasarkan ekstensi
         file_extension = Path(file_path).suffix.lower()
         
-        # Deteksi berdasarkan MIME type sebagai backup
-        mime_type, _ = mimetypes.guess_type(file_path)
+        if self.verbose:
+            # Deteksi berdasarkan MIME type sebagai backup
+            mime_type, _ = mimetypes.guess_type(file_path)
+            print(f"File: {file_path}")
+            print(f"Ekstensi: {file_extension}")
+            print(f"MIME Type: {mime_type}")
         
-        print(f"File: {file_path}")
-        print(f"Ekstensi: {file_extension}")
-        print(f"MIME Type: {mime_type}")
+        # File kosong (baru dibuat) belum punya isi untuk diperiksa
+        if not check_content or stat.st_size == 0:
+            return file_extension
         
+        # Untuk ekstensi yang dikenal cukup diperiksa tanda tangan biner (PK/%PDF/NUL);
+        # klasifikasi teks (csv/json/...) hanya dibutuhkan jika ekstensi tidak dikenal
+        known = file_extension in self.supported_formats
+        sniffed = self._cached_sniff(file_path, stat, classify_text=not known)
+        if not known:
+            return sniffed or file_extension
+        
+        if (file_extension in BINARY_FORMATS or sniffed in BINARY_FORMATS) and sniffed != file_extension:
+            raise ValueError(f"Isi file {file_path} tidak sesuai dengan ekstensi {file_extension} "
+                             f"(terdeteksi: {sniffed or 'tidak dikenal'})")
         return file_extension
     
-    def process_document(self, file_path: str, operation: str, **kwargs) -> Any:
-        """Memproses dokumen berdasarkan tipe dan operasi yang diminta"""
-        doc_type = self.detect_document_type(file_path)
+    def _cached_sniff(self, file_path: str, stat: os.stat_result, classify_text: bool = True) -> Optional[str]:
+        """Mengambil hasil sniffing dari cache metadata, dikunci dengan ukuran + mtime"""
+        key = os.path.abspath(file_path)
+        signature = (stat.st_size, stat.st_mtime_ns, classify_text)
+        cached = self._type_cache.get(key)
+        if cached and cached[0] == signature:
+            self._type_cache.move_to_end(key)
+            return cached[1]
+        
+        sniffed = self.sniff_document_type(file_path, classify_text=classify_text)
+        self._type_cache[key] = (signature, sniffed)
+        if len(self._type_cache) > self._type_cache_size:
+            self._type_cache.popitem(last=False)
+        return sniffed
+    
+    def sniff_document_type(self, file_path: str, sample_size: int = 8192,
+                            classify_text: bool = True) -> Optional[str]:
+        """Menebak tipe dokumen dari beberapa byte awal file atau stream, None jika tidak dikenali
+        
+        Dengan classify_text=False hanya format biner yang dikenali; file teks
+        menghasilkan None tanpa menjalankan heuristik csv/json.
+        """
+        with self._open_source(file_path, 'rb') as file:
+            sample = file.read(sample_size)
+            truncated = bool(file.read(1))
+        
+        if sample.startswith(b'%PDF'):
+            return '.pdf'
+        
+        if sample.startswith(b'PK\x03\x04'):
+            return self._sniff_ooxml(file_path)
+        
+        if b'\x00' in sample and not sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            return None
+        if not classify_text:
+            return None
+        
+        text = sample.decode(self._sample_encoding(sample), errors='replace').lstrip('\ufeff \t\r\n')
+        if text.startswith('<'):
+            return '.xml'
+        
+        lines = text.splitlines()
+        if truncated and len(lines) > 1:
+            # Baris terakhir sampel mungkin terpotong
+            lines = lines[:-1]
+        
+        if text.startswith(('{', '[')):
+            non_empty = [line for line in lines if line.strip()]
+            if len(non_empty) > 1 and all(line.lstrip().startswith(('{', '[')) for line in non_empty):
+                try:
+                    json.loads(non_empty[0])
+                    return '.jsonl'
+                except ValueError:
+                    pass
+            return '.json'
+        
+        if len(lines) > 1:
+            try:
+                dialect = csv.Sniffer().sniff('\n'.join(lines), delimiters=',;\t|')
+                widths = {len(row) for row in csv.reader(lines, dialect)}
+                if len(widths) == 1 and widths.pop() > 1:
+                    return '.csv'
+            except csv.Error:
+                pass
+        return '.txt'
+    
+    def _sniff_ooxml(self, file_path: str) -> Optional[str]:
+        """Membedakan docx dan xlsx dari [Content_Types].xml di dalam arsip ZIP"""
+        try:
+            with zipfile.ZipFile(self._input(file_path)) as archive:
+                content_types = archive.read('[Content_Types].xml')
+        except (zipfile.BadZipFile, KeyError, OSError):
+            return None
+        
+        if b'wordprocessingml.document.main' in content_types:
+            return '.docx'
+        if b'spreadsheetml.sheet.main' in content_types:
+            return '.xlsx'
+        return None
+    
+    def _is_stream(self, source: Any) -> bool:
+        """True jika sumber dokumen bukan path (bytes, memoryview atau objek file-like)"""
+        return not isinstance(source, (str, os.PathLike))
+    
+    def _prepare_stream(self, source: Any, operation: str, doc_type: Optional[str]) -> tuple:
+        """Menyiapkan stream input/output dan menentukan tipe dokumennya"""
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            if operation not in READ_OPERATIONS:
+                raise ValueError(f"Operasi {operation} membutuhkan stream yang bisa ditulis (misalnya BytesIO), bukan bytes")
+            # BytesIO dari bytes berbagi buffer yang sama selama tidak ditulis
+            source = io.BytesIO(source)
+        elif not source.seekable():
+            if operation in READ_OPERATIONS:
+                source = io.BytesIO(source.read())
+            elif operation != "write":
+                raise ValueError(f"Operasi {operation} membutuhkan stream yang mendukung seek")
+        
+        if doc_type is None and getattr(source, 'name', None) and isinstance(source.name, str):
+            doc_type = Path(source.name).suffix.lower() or None
+        if doc_type is None and operation != "write":
+            doc_type = self.sniff_document_type(source)
+        if doc_type is None:
+            raise ValueError("Tipe dokumen stream tidak dapat ditentukan, berikan argumen doc_type")
+        return source, doc_type.lower()
+    
+    @contextmanager
+    def _open_source(self, source: Any, mode: str = 'r', encoding: Optional[str] = 'utf-8',
+                     newline: Optional[str] = None):
+        """Membuka path seperti open(), atau membungkus stream tanpa menutupnya di akhir"""
+        if not self._is_stream(source):
+            if 'b' in mode:
+                with open(source, mode) as file:
+                    yield file
+            else:
+                with open(source, mode, encoding=encoding, newline=newline) as file:
+                    yield file
+            return
+        
+        if source.seekable():
+            if 'w' in mode:
+                source.seek(0)
+                source.truncate()
+            elif 'a' in mode:
+                source.seek(0, os.SEEK_END)
+            else:
+                source.seek(0)
+        
+        if 'b' in mode:
+            yield source
+            return
+        
+        wrapper = io.TextIOWrapper(source, encoding=encoding, newline=newline)
+        try:
+            yield wrapper
+        finally:
+            if not wrapper.closed:
+                wrapper.flush()
+                wrapper.detach()
+    
+    def _input(self, source: Any) -> Any:
+        """Menyiapkan sumber untuk library parser: path apa adanya, stream diputar ke awal"""
+        if self._is_stream(source) and source.seekable():
+            source.seek(0)
+        return source
+    
+    def _output(self, source: Any) -> Any:
+        """Menyiapkan tujuan save: path apa adanya, stream dikosongkan dulu"""
+        if self._is_stream(source) and source.seekable():
+            source.seek(0)
+            source.truncate()
+        return source
+    
+    def _source_size(self, source: Any) -> int:
+        """Ukuran dokumen dalam byte untuk path maupun stream"""
+        try:
+            if not self._is_stream(source):
+                return os.path.getsize(source)
+            if isinstance(source, io.BytesIO):
+                return source.getbuffer().nbytes
+            if source.seekable():
+                position = source.tell()
+                size = source.seek(0, os.SEEK_END)
+                source.seek(position)
+                return size
+        except (OSError, ValueError):
+            pass
+        return 0
+    
+    def process_document(self, file_path: Any, operation: str, **kwargs) -> Any:
+        """Memproses dokumen berdasarkan tipe dan operasi yang diminta
+        
+        file_path boleh berupa path, bytes/memoryview (hanya operasi baca) atau
+        objek file-like seperti BytesIO. Untuk stream, tipe dokumen diambil dari
+        argumen doc_type (misalnya doc_type='.xlsx') atau dideteksi dari isinya.
+        Operasi write/append/replace/update menulis hasilnya ke stream tersebut.
+        """
+        if self._is_stream(file_path):
+            file_path, doc_type = self._prepare_stream(file_path, operation, kwargs.pop('doc_type', None))
+            if doc_type not in self.supported_formats:
+                raise ValueError(f"Format {doc_type} tidak didukung. Format yang didukung: {list(self.supported_formats.keys())}")
+            if operation == "read" and kwargs.pop('stream', False):
+                operation = "iter_rows"
+            return self._call_handler(doc_type, file_path, operation, kwargs)
+        
+        if operation == "write":
+            # Write menimpa seluruh isi file, jadi file boleh belum ada dan isinya tidak diperiksa
+            doc_type = Path(file_path).suffix.lower()
+            if os.path.exists(file_path):
+                doc_type = self.detect_document_type(file_path, check_content=False)
+        else:
+            doc_type = self.detect_document_type(file_path)
         
         if doc_type not in self.supported_formats:
             raise ValueError(f"Format {doc_type} tidak didukung. Format yang didukung: {list(self.supported_formats.keys())}")
         
-        processor = self.supported_formats[doc_type]
-        return processor(file_path, operation, **kwargs)
+        # stream=True pada operasi read dialihkan ke iterator baris
+        if operation == "read" and kwargs.pop('stream', False):
+            operation = "iter_rows"
+        
+        if self.cache is None:
+            return self._call_handler(doc_type, file_path, operation, kwargs)
+        
+        if operation != "read":
+            # Operasi yang dapat mengubah file membuang entri cache
+            if operation not in READ_OPERATIONS:
+                self.cache.invalidate(file_path)
+            return self._call_handler(doc_type, file_path, operation, kwargs)
+        
+        key = self.cache.make_key(file_path, **kwargs)
+        cached = self.cache.get(key) if key else None
+        if cached is not None:
+            return cached
+        
+        result = self._call_handler(doc_type, file_path, operation, kwargs)
+        if key:
+            self.cache.put(key, result)
+        return result
+    
+    def add_hook(self, before=None, after=None):
+        """Mendaftarkan callback di sekitar setiap panggilan handler _process_*
+        
+        before(event) dipanggil sebelum handler, after(event) sesudahnya. event
+        berisi doc_type, file_path, operation, kwargs, dan pada after juga
+        duration, error serta file_bytes (ukuran file sesudah operasi).
+        """
+        self._hooks.append((before, after))
+    
+    def _call_handler(self, doc_type: str, file_path: str, operation: str, kwargs: Dict[str, Any]) -> Any:
+        """Memanggil handler format sambil mencatat metrik dan menjalankan hook"""
+        event = {'doc_type': doc_type, 'file_path': file_path, 'operation': operation, 'kwargs': kwargs}
+        for before, _ in self._hooks:
+            if before:
+                before(event)
+        
+        start = time.perf_counter()
+        try:
+            result = self.supported_formats[doc_type](file_path, operation, **kwargs)
+        except Exception as e:
+            self._finish_call(event, start, e)
+            raise
+        
+        if isinstance(result, types.GeneratorType):
+            # Untuk hasil lazy, waktu dihitung sampai generator habis atau ditutup
+            return self._instrument_generator(result, event, start)
+        
+        self._finish_call(event, start, None)
+        return result
+    
+    def _instrument_generator(self, generator: Iterator, event: Dict[str, Any], start: float) -> Iterator:
+        error = None
+        try:
+            yield from generator
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self._finish_call(event, start, error if isinstance(error, Exception) else None)
+    
+    def _finish_call(self, event: Dict[str, Any], start: float, error: Optional[Exception]):
+        event['duration'] = time.perf_counter() - start
+        event['error'] = error
+        event['file_bytes'] = self._source_size(event['file_path'])
+        
+        self.metrics.record(event['doc_type'], event['operation'], event['duration'], error is not None,
+                            event['file_bytes'])
+        for _, after in self._hooks:
+            if after:
+                after(event)
+    
+    def profile_document(self, file_path: str, operation: str, mode: str = "cprofile",
+                         top: int = 20, **kwargs) -> Dict[str, Any]:
+        """Menjalankan satu process_document dengan cProfile atau tracemalloc
+        
+        Mengembalikan dict berisi result, report (teks laporan) dan untuk mode
+        tracemalloc juga peak_bytes. Hasil berupa generator langsung dihabiskan
+        menjadi list agar seluruh pekerjaan ikut terprofil.
+        """
+        if mode not in ("cprofile", "tracemalloc"):
+            raise ValueError(f"Mode profil {mode} tidak dikenal. Pilihan: cprofile, tracemalloc")
+        # Modul profiling hanya dibutuhkan di sini, tidak dimuat saat import app
+        import cProfile
+        import pstats
+        import tracemalloc
+        
+        def run():
+            result = self.process_document(file_path, operation, **kwargs)
+            return list(result) if isinstance(result, types.GeneratorType) else result
+        
+        if mode == "cprofile":
+            profiler = cProfile.Profile()
+            result = profiler.runcall(run)
+            report = io.StringIO()
+            pstats.Stats(profiler, stream=report).sort_stats('cumulative').print_stats(top)
+            return {'result': result, 'report': report.getvalue()}
+        
+        started_here = not tracemalloc.is_tracing()
+        if started_here:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        try:
+            result = run()
+            _, peak = tracemalloc.get_traced_memory()
+            top_stats = tracemalloc.take_snapshot().statistics('lineno')[:top]
+        finally:
+            if started_here:
+                tracemalloc.stop()
+        report = '\n'.join(str(stat) for stat in top_stats)
+        return {'result': result, 'report': report, 'peak_bytes': peak}
+    
+    def extract_text(self, file_path: str) -> str:
+        """Mengambil teks polos dari dokumen format apa pun yang didukung"""
+        if not self._is_stream(file_path) and Path(file_path).suffix.lower() == '.xml':
+            # Untuk XML hanya isi teks element yang diambil, tanpa tag
+            self.detect_document_type(file_path)
+            return ' '.join(ET.parse(file_path).getroot().itertext())
+        if not self._is_stream(file_path) and Path(file_path).suffix.lower() == '.docx':
+            # Blok dari XML .docx juga memuat tabel, header, footer dan catatan kaki
+            self.detect_document_type(file_path)
+            return '\n'.join(block['text'] for block in self._iter_docx_blocks(file_path))
+        return self._flatten_text(self.process_document(file_path, "read"))
+    
+    def _flatten_text(self, data: Any) -> str:
+        """Helper untuk meratakan hasil read (baris, dict, list) menjadi teks"""
+        if data is None:
+            return ''
+        if isinstance(data, str):
+            return data
+        if isinstance(data, dict):
+            return '\n'.join(self._flatten_text(value) for value in data.values())
+        if isinstance(data, (list, tuple)):
+            if all(not isinstance(item, (list, tuple, dict)) for item in data):
+                return ' '.join(self._flatten_text(item) for item in data)
+            return '\n'.join(self._flatten_text(item) for item in data)
+        return str(data)
+    
+    def open_for_edit(self, file_path: str) -> 'EditSession':
+        """Membuka dokumen untuk banyak perubahan sekaligus dalam satu sesi
+        
+        Contoh:
+            with processor.open_for_edit("data.xlsx") as doc:
+                doc.apply("update_cell", row=2, col=3, value=8)
+        """
+        doc_type = self.detect_document_type(file_path)
+        if doc_type not in EditSession.EDITABLE_FORMATS:
+            raise ValueError(f"Format {doc_type} tidak didukung untuk sesi edit. Format yang didukung: {list(EditSession.EDITABLE_FORMATS)}")
+        return EditSession(self, file_path, doc_type)
+    
+    def buffered_appender(self, file_path: str, batch_size: int = 1000) -> 'BufferedAppender':
+        """Membuat penampung baris yang ditambahkan ke file per batch (XLSX, CSV, JSONL)
+        
+        Contoh:
+            with processor.buffered_appender("laporan.xlsx", batch_size=5000) as appender:
+                for row in rows:
+                    appender.append(row)
+        """
+        doc_type = self.detect_document_type(file_path)
+        if doc_type not in BufferedAppender.APPENDABLE_FORMATS:
+            raise ValueError(f"Format {doc_type} tidak didukung untuk append per batch. Format yang didukung: {list(BufferedAppender.APPENDABLE_FORMATS)}")
+        return BufferedAppender(self, file_path, batch_size)
+    
+    def convert(self, src: Any, dst: Any, **kwargs) -> str:
+        """Mengkonversi dokumen antar format secara streaming, misalnya XLSX->CSV atau XML->JSON
+        
+        Isi sumber dibaca sebagai baris (CSV/XLSX), record (JSONL, anak root XML),
+        baris teks (TXT, paragraf DOCX, halaman PDF) atau satu objek utuh (JSON,
+        XML ke JSON) lalu langsung dialirkan ke penulis format tujuan. Tipe
+        diambil dari ekstensi atau argumen src_type/dst_type (wajib untuk stream).
+        Argumen header=False membuat baris pertama tabel tidak dipakai sebagai
+        nama kolom saat dikonversi ke record. Sumber XLSX memakai nilai hasil
+        rumus yang tersimpan (data_only=True, default) dan sheet dapat dipilih
+        dengan argumen sheet; sumber DOCX ikut membawa tabel, header dan footer.
+        """
+        src_type = kwargs.get('src_type') or (self.detect_document_type(src) if not self._is_stream(src) else None)
+        dst_type = kwargs.get('dst_type') or (Path(dst).suffix.lower() if not self._is_stream(dst) else None)
+        if not src_type or not dst_type:
+            raise ValueError("Tipe sumber/tujuan tidak dapat ditentukan, berikan argumen src_type/dst_type")
+        
+        kind, items = self._convert_source(src, src_type, dst_type, kwargs)
+        count = self._convert_sink(dst, dst_type, kind, items, kwargs.get('header', True),
+                                   kwargs.get('root_name', 'root'))
+        
+        if self.cache is not None and not self._is_stream(dst):
+            self.cache.invalidate(dst)
+        return f"{src_type} berhasil dikonversi ke {dst_type} ({count} item)"
+    
+    def _convert_source(self, src: Any, src_type: str, dst_type: str,
+                        options: Optional[Dict[str, Any]] = None) -> tuple:
+        """Membuka sumber konversi sebagai (jenis, iterator): rows, records, lines atau tree"""
+        options = options or {}
+        if src_type == '.csv':
+            return 'rows', self._iter_csv_rows(src)
+        if src_type == '.xlsx':
+            return 'rows', self._iter_excel_rows(src, options.get('sheet'), options.get('cell_range'),
+                                                 data_only=options.get('data_only', True))
+        if src_type == '.jsonl':
+            return 'records', self._iter_jsonl_records(src)
+        if src_type == '.txt':
+            return 'lines', self._iter_text_lines(src, self._detect_text_encoding(src))
+        if src_type == '.docx':
+            return 'lines', (block['text'] for block in self._iter_docx_blocks(src))
+        if src_type == '.pdf':
+            return 'lines', self._iter_pdf_pages(src)
+        if src_type == '.json':
+            with self._open_source(src, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+            if isinstance(data, list) and dst_type != '.json':
+                return 'records', iter(data)
+            return 'tree', iter([data])
+        if src_type == '.xml':
+            if dst_type in ('.json', '.xml'):
+                return 'tree', iter([self._xml_to_dict(ET.parse(self._input(src)).getroot())])
+            # Setiap anak langsung root menjadi satu record
+            elements = self._iter_xml_elements(src, lambda stack: len(stack) == 2)
+            return 'records', (self._xml_to_dict(element) for element in elements)
+        raise ValueError(f"Konversi dari format {src_type} tidak didukung")
+    
+    def _convert_sink(self, dst: Any, dst_type: str, kind: str, items: Iterator, header: bool = True,
+                      root_name: str = 'root') -> int:
+        """Menulis item hasil _convert_source ke format tujuan, mengembalikan jumlah item"""
+        count = 0
+        
+        if dst_type == '.csv':
+            with self._open_source(dst, 'w', newline='', encoding='utf-8') as file:
+                writer = csv.writer(file)
+                for row in self._as_rows(kind, items):
+                    writer.writerow(row)
+                    count += 1
+        
+        elif dst_type == '.xlsx':
+            workbook = Workbook(write_only=True)
+            sheet = workbook.create_sheet()
+            for row in self._as_rows(kind, items):
+                sheet.append(list(row))
+                count += 1
+            workbook.save(self._output(dst))
+        
+        elif dst_type == '.jsonl':
+            with self._open_source(dst, 'w', encoding='utf-8') as file:
+                for record in self._as_records(kind, items, header):
+                    file.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+                    count += 1
+        
+        elif dst_type == '.json':
+            with self._open_source(dst, 'w', encoding='utf-8') as file:
+                if kind == 'tree':
+                    json.dump(next(items), file, indent=2, ensure_ascii=False, default=str)
+                    count = 1
+                else:
+                    # Array JSON ditulis elemen per elemen tanpa menampung seluruh data
+                    records = self._counted(self._as_records(kind, items, header))
+                    self._write_buffered(file, self._json_array_pieces(records, default=str))
+                    count = records.count
+        
+        elif dst_type == '.xml':
+            with self._open_source(dst, 'w', encoding='utf-8') as file:
+                if kind == 'tree':
+                    data = next(items)
+                    pieces = self._xml_document_pieces(root_name, data if isinstance(data, dict) else {'item': data})
+                    count = 1
+                else:
+                    records = self._counted(record if isinstance(record, dict) else {'value': record}
+                                            for record in self._as_records(kind, items, header))
+                    pieces = self._xml_document_pieces(root_name, records=records)
+                self._write_buffered(file, pieces)
+                if kind != 'tree':
+                    count = records.count
+        
+        elif dst_type == '.txt':
+            with self._open_source(dst, 'w', encoding='utf-8') as file:
+                for line in self._as_lines(kind, items):
+                    file.write(('\n' if count else '') + line)
+                    count += 1
+        
+        elif dst_type == '.docx':
+            doc = Document()
+            for line in self._as_lines(kind, items):
+                doc.add_paragraph(line)
+                count += 1
+            doc.save(self._output(dst))
+        
+        else:
+            raise ValueError(f"Konversi ke format {dst_type} tidak didukung")
+        
+        return count
+    
+    def _as_rows(self, kind: str, items: Iterator) -> Iterator[list]:
+        """Mengubah item konversi menjadi baris tabel; record dict menghasilkan baris header dulu"""
+        if kind == 'rows':
+            yield from items
+        elif kind == 'lines':
+            for line in items:
+                yield [line]
+        else:
+            columns = None
+            for record in items:
+                if not isinstance(record, dict):
+                    yield record if isinstance(record, list) else [record]
+                    continue
+                if columns is None:
+                    columns = list(record)
+                    yield columns
+                yield [self._cell_value(record.get(column)) for column in columns]
+    
+    def _as_records(self, kind: str, items: Iterator, header: bool = True) -> Iterator[Any]:
+        """Mengubah item konversi menjadi record; baris pertama tabel menjadi nama kolom"""
+        if kind == 'rows':
+            columns = None
+            for row in items:
+                if header and columns is None:
+                    columns = [str(column) for column in row]
+                    continue
+                yield dict(zip(columns, row)) if columns else list(row)
+        elif kind == 'lines':
+            for line in items:
+                yield {'text': line}
+        else:
+            yield from items
+    
+    def _as_lines(self, kind: str, items: Iterator) -> Iterator[str]:
+        """Mengubah item konversi menjadi baris teks (kolom tabel dipisah tab)"""
+        for item in items:
+            if kind == 'lines':
+                yield item
+            elif kind == 'rows':
+                yield '\t'.join('' if value is None else str(value) for value in item)
+            else:
+                yield self._flatten_text(item)
+    
+    def _cell_value(self, value: Any) -> Any:
+        """Nilai bertingkat (dict/list) disimpan sebagai teks JSON di dalam sel"""
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, ensure_ascii=False, default=str)
+        return value
+    
+    def process_batch(self, paths: Iterable[str], operation: str, workers: Optional[int] = None,
+                      executor: str = "auto", max_in_flight: Optional[int] = None, **kwargs) -> Iterator[Dict[str, Any]]:
+        """Memproses banyak file secara paralel, hasil dikembalikan sesuai urutan selesai
+        
+        executor "auto" mengirim format berat CPU (CPU_BOUND_FORMATS) ke process pool
+        dan format lain ke thread pool; jika kedua pool terpakai, jumlah job yang
+        berjalan bersamaan tetap dibatasi workers. Error per file dicatat di
+        hasil tanpa menghentikan batch. Hasil operasi lazy selalu dibaca habis
+        menjadi list, sehingga tidak ada file yang tetap terbuka.
+        """
+        if executor not in ("auto", "process", "thread"):
+            raise ValueError(f"Executor {executor} tidak dikenal. Pilihan: auto, process, thread")
+        # concurrent.futures memuat logging dan multiprocessing, jadi baru diimport saat batch dipakai
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+        
+        workers = workers or os.cpu_count() or 1
+        max_in_flight = max_in_flight or workers * 2
+        pools = {}
+        pending = {}
+        
+        def route(file_path):
+            kind = executor
+            if kind == "auto":
+                kind = "process" if Path(file_path).suffix.lower() in CPU_BOUND_FORMATS else "thread"
+            if kind not in pools:
+                pool_class = ProcessPoolExecutor if kind == "process" else ThreadPoolExecutor
+                pools[kind] = pool_class(max_workers=workers)
+            return kind
+        
+        def submit(kind, file_path):
+            if kind == "process":
+                return pools[kind].submit(_process_in_worker, file_path, operation, kwargs, self.verbose)
+            return pools[kind].submit(self._process_materialized, file_path, operation, kwargs)
+        
+        def collect(futures):
+            for future in futures:
+                file_path = pending.pop(future)
+                try:
+                    yield {'file_path': file_path, 'result': future.result(), 'error': None}
+                except Exception as e:
+                    yield {'file_path': file_path, 'result': None, 'error': f"{type(e).__name__}: {e}"}
+        
+        try:
+            for file_path in paths:
+                try:
+                    kind = route(file_path)
+                except Exception as e:
+                    yield {'file_path': file_path, 'result': None, 'error': f"{type(e).__name__}: {e}"}
+                    continue
+                
+                # Dua pool masing-masing berukuran workers: job yang sedang berjalan dibatasi bersama
+                limit = max_in_flight if len(pools) < 2 else min(max_in_flight, workers)
+                while len(pending) >= limit:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    yield from collect(done)
+                
+                try:
+                    pending[submit(kind, file_path)] = file_path
+                except Exception as e:
+                    yield {'file_path': file_path, 'result': None, 'error': f"{type(e).__name__}: {e}"}
+            
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                yield from collect(done)
+        finally:
+            for pool in pools.values():
+                pool.shutdown(wait=True, cancel_futures=True)
+    
+    def _process_materialized(self, file_path: str, operation: str, kwargs: Dict[str, Any]) -> Any:
+        """process_document dengan hasil lazy dibaca habis, seperti di worker process"""
+        result = self.process_document(file_path, operation, **kwargs)
+        if isinstance(result, Iterator):
+            result = list(result)
+        return result
+    
+    def _batch_rows(self, rows: Iterable, chunk_size: Optional[int]) -> Iterator:
+        """Helper untuk mengelompokkan baris menjadi batch berisi chunk_size baris"""
+        if not chunk_size:
+            yield from rows
+            return
+        
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= chunk_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
     
     def _process_text(self, file_path: str, operation: str, **kwargs) -> Any:
-        """Memproses file teks (.txt)"""
-        if operation == "read":
-            with open(file_path, 'r', encoding='utf-8') as file:
-                return file.read()
+        """Memproses file teks (.txt)
         
-        elif operation == "write":
+        Encoding dideteksi otomatis (BOM, lalu utf-8, lalu cp1252/latin-1) kecuali
+        diberikan lewat argumen encoding.
+        """
+        if operation == "write":
             content = kwargs.get('content', '')
-            with open(file_path, 'w', encoding='utf-8') as file:
+            with self._open_source(file_path, 'w', encoding=kwargs.get('encoding', 'utf-8')) as file:
                 file.write(content)
             return f"File {file_path} berhasil ditulis"
         
+        encoding = kwargs.get('encoding') or self._detect_text_encoding(file_path)
+        
+        if operation == "read":
+            if 'byte_range' in kwargs:
+                return self._read_text_bytes(file_path, encoding, *kwargs['byte_range'])
+            with self._open_source(file_path, 'r', encoding=encoding) as file:
+                return file.read()
+        
+        elif operation == "read_lines":
+            return self._read_text_lines(file_path, encoding, kwargs.get('start', 0), kwargs.get('stop'))
+        
+        elif operation == "tail":
+            return self._tail_text(file_path, encoding, kwargs.get('n', 10))
+        
+        elif operation == "index_lines":
+            return len(self._line_index(file_path, encoding))
+        
+        elif operation == "iter_rows":
+            return self._batch_rows(self._iter_text_lines(file_path, encoding), kwargs.get('chunk_size'))
+        
         elif operation == "append":
             content = kwargs.get('content', '')
-            with open(file_path, 'a', encoding='utf-8') as file:
-                file.write('\n' + content)
+            # Baris baru hanya ditambahkan jika file belum kosong dan belum diakhiri newline
+            needs_newline = False
+            with self._open_source(file_path, 'rb') as file:
+                if file.seek(0, os.SEEK_END) > 0:
+                    file.seek(-1, os.SEEK_END)
+                    needs_newline = file.read(1) != b'\n'
+            with self._open_source(file_path, 'a', encoding=encoding) as file:
+                file.write(('\n' if needs_newline else '') + content)
             return f"Konten berhasil ditambahkan ke {file_path}"
         
         elif operation == "replace":
-            old_text = kwargs.get('old_text', '')
-            new_text = kwargs.get('new_text', '')
-            
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
+            replacer = self._compile_replacements(self._replacement_map(kwargs), kwargs.get('regex', False))
+            count = self._stream_replace_text(file_path, replacer, kwargs.get('chunk_size', 1024 * 1024),
+                                              kwargs.get('max_match_len'), encoding)
             
-            updated_content = content.replace(old_text, new_text)
+            if 'replacements' not in kwargs:
+                return f"Teks '{kwargs.get('old_text', '')}' berhasil diganti dengan '{kwargs.get('new_text', '')}'"
+            return f"{count} teks berhasil diganti"
+    
+    def _replacement_map(self, kwargs: Dict[str, Any]) -> Dict[str, str]:
+        """Mengambil pasangan pola/pengganti dari argumen replacements atau old_text/new_text"""
+        if 'replacements' in kwargs:
+            return dict(kwargs['replacements'])
+        return {kwargs.get('old_text', ''): kwargs.get('new_text', '')}
+    
+    def _compile_replacements(self, replacements: Dict[str, str], regex: bool = False) -> Optional[tuple]:
+        """Menggabungkan semua pola menjadi satu regex agar penggantian cukup satu kali lintas
+        
+        Mengembalikan tuple (pattern, fungsi pengganti, panjang match maksimum) atau
+        None jika tidak ada pola. Pada mode regex, pengganti diperlakukan sebagai teks
+        literal dan panjang match maksimum tidak diketahui (None).
+        """
+        patterns = [p for p in replacements if p]
+        if not patterns:
+            return None
+        
+        if not regex:
+            # Pola terpanjang didahulukan supaya alternation memilih match terpanjang
+            patterns.sort(key=len, reverse=True)
+            pattern = re.compile('|'.join(re.escape(p) for p in patterns))
+            return pattern, lambda match: replacements[match.group(0)], len(patterns[0])
+        
+        # Setiap pola dibungkus group, nomor group luar dipetakan ke penggantinya
+        group_lookup = {}
+        parts = []
+        group_index = 1
+        for p in patterns:
+            group_lookup[group_index] = replacements[p]
+            parts.append(f'({p})')
+            group_index += 1 + re.compile(p).groups
+        pattern = re.compile('|'.join(parts))
+        return pattern, lambda match: group_lookup[match.lastindex], None
+    
+    def _stream_replace_text(self, file_path: str, replacer: Optional[tuple], chunk_size: int = 1024 * 1024,
+                             max_match_len: Optional[int] = None, encoding: str = 'utf-8') -> int:
+        """Mengganti teks per potongan file, match yang melewati batas potongan tetap ditangani
+        
+        Bagian akhir setiap potongan sepanjang max_match_len ditahan dan digabung dengan
+        potongan berikutnya. Untuk pola regex, max_match_len default 1024 karakter.
+        """
+        if replacer is None:
+            return 0
+        pattern, lookup, literal_max = replacer
+        overlap = max((max_match_len or literal_max or 1024) - 1, 0)
+        
+        if self._is_stream(file_path):
+            # Stream sudah berada di memori, cukup diganti dalam satu kali lintas
+            with self._open_source(file_path, 'r', encoding=encoding, newline='') as source:
+                content = source.read()
+            content, count = pattern.subn(lookup, content)
+            with self._open_source(file_path, 'w', encoding=encoding, newline='') as target:
+                target.write(content)
+            return count
+        
+        directory = os.path.dirname(os.path.abspath(file_path))
+        fd, temp_file = tempfile.mkstemp(dir=directory, suffix='.txt.tmp')
+        count = 0
+        try:
+            with open(file_path, 'r', encoding=encoding, newline='') as source, \
+                    os.fdopen(fd, 'w', encoding=encoding, newline='') as target:
+                buffer = ''
+                while True:
+                    chunk = source.read(chunk_size)
+                    buffer += chunk
+                    # Match yang dimulai sebelum cutoff pasti sudah lengkap di dalam buffer
+                    cutoff = len(buffer) if not chunk else len(buffer) - overlap
+                    
+                    position = 0
+                    for match in pattern.finditer(buffer):
+                        # Match regex yang menyentuh ujung buffer mungkin masih bisa memanjang
+                        if chunk and (match.start() >= cutoff or
+                                      (literal_max is None and match.end() >= len(buffer))):
+                            cutoff = min(cutoff, match.start())
+                            break
+                        target.write(buffer[position:match.start()])
+                        target.write(lookup(match))
+                        position = match.end()
+                        count += 1
+                    
+                    if not chunk:
+                        target.write(buffer[position:])
+                        break
+                    
+                    keep_from = max(position, cutoff)
+                    target.write(buffer[position:keep_from])
+                    buffer = buffer[keep_from:]
             
-            with open(file_path, 'w', encoding='utf-8') as file:
-                file.write(updated_content)
+            shutil.copymode(file_path, temp_file)
+            os.replace(temp_file, file_path)
+        except BaseException:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            raise
+        
+        return count
+    
+    def _iter_text_lines(self, file_path: str, encoding: str = 'utf-8') -> Iterator[str]:
+        """Membaca file teks baris per baris tanpa memuat seluruh isi file"""
+        with self._open_source(file_path, 'r', encoding=encoding) as file:
+            for line in file:
+                yield line.rstrip('\r\n')
+    
+    def _detect_text_encoding(self, file_path: str, sample_size: int = 64 * 1024) -> str:
+        """Mendeteksi encoding file teks dari BOM dan sampel awal file"""
+        with self._open_source(file_path, 'rb') as file:
+            return self._sample_encoding(file.read(sample_size))
+    
+    def _sample_encoding(self, sample: bytes) -> str:
+        """Menebak encoding dari sampel byte yang sudah dibaca"""
+        # BOM utf-32 LE diawali BOM utf-16 LE, jadi utf-32 dicek lebih dulu
+        for bom, encoding in ((codecs.BOM_UTF32_LE, 'utf-32'), (codecs.BOM_UTF32_BE, 'utf-32'),
+                              (codecs.BOM_UTF8, 'utf-8-sig'), (codecs.BOM_UTF16_LE, 'utf-16'),
+                              (codecs.BOM_UTF16_BE, 'utf-16')):
+            if sample.startswith(bom):
+                return encoding
+        
+        for encoding in ('utf-8', 'cp1252'):
+            try:
+                # Decoder incremental supaya karakter multibyte yang terpotong di akhir sampel tidak dianggap error
+                codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+                return encoding
+            except UnicodeDecodeError:
+                continue
+        return 'latin-1'
+    
+    @contextmanager
+    def _map_text(self, file_path: str, encoding: str):
+        """Memetakan file teks ke memori (mmap) untuk akses byte tanpa menyalin isi file"""
+        if encoding.startswith(('utf-16', 'utf-32')):
+            raise ValueError(f"Akses per byte/baris tidak didukung untuk encoding {encoding}")
+        
+        if self._is_stream(file_path):
+            with self._open_source(file_path, 'rb') as file:
+                yield file.read()
+            return
+        
+        with open(file_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                yield b''
+                return
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                yield mapped
+            finally:
+                mapped.close()
+    
+    def _decode_text(self, data: bytes, encoding: str) -> str:
+        # BOM utf-8 hanya ada di awal file, potongan di tengah didecode sebagai utf-8 biasa
+        return data.decode('utf-8' if encoding == 'utf-8-sig' else encoding, errors='replace').lstrip('\ufeff')
+    
+    def _read_text_bytes(self, file_path: str, encoding: str, start: int, end: Optional[int] = None) -> str:
+        """Membaca rentang byte [start, end) dari file teks"""
+        with self._map_text(file_path, encoding) as mapped:
+            return self._decode_text(mapped[start:end], encoding)
+    
+    def _line_index(self, file_path: str, encoding: str) -> array:
+        """Membuat (atau mengambil dari cache) offset byte awal setiap baris file teks"""
+        if self._is_stream(file_path):
+            raise ValueError("Index baris hanya tersedia untuk file, bukan stream")
+        abs_path = os.path.abspath(file_path)
+        stat = os.stat(abs_path)
+        cached = self._line_indexes.get(abs_path)
+        if cached and cached[0] == (stat.st_size, stat.st_mtime_ns):
+            return cached[1]
+        
+        offsets = array('Q')
+        with self._map_text(file_path, encoding) as mapped:
+            size = len(mapped)
+            position = 0
+            while position < size:
+                offsets.append(position)
+                newline = mapped.find(b'\n', position)
+                if newline < 0:
+                    break
+                position = newline + 1
+        
+        self._line_indexes[abs_path] = ((stat.st_size, stat.st_mtime_ns), offsets)
+        return offsets
+    
+    def _read_text_lines(self, file_path: str, encoding: str, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        """Membaca baris ke-start sampai sebelum stop (mulai 0)
+        
+        Jika index baris sudah dibuat (operasi index_lines), posisi baris dicari
+        langsung lewat offset, tanpa membaca baris-baris sebelumnya.
+        """
+        cached = None if self._is_stream(file_path) else self._line_indexes.get(os.path.abspath(file_path))
+        if cached is None:
+            return list(islice(self._iter_text_lines(file_path, encoding), start, stop))
+        
+        offsets = self._line_index(file_path, encoding)
+        if start >= len(offsets):
+            return []
+        stop = len(offsets) if stop is None else min(stop, len(offsets))
+        with self._map_text(file_path, encoding) as mapped:
+            end = offsets[stop] if stop < len(offsets) else len(mapped)
+            text = self._decode_text(mapped[offsets[start]:end], encoding)
+        return [line.rstrip('\r') for line in text.split('\n')[:stop - start]]
+    
+    def _tail_text(self, file_path: str, encoding: str, n: int = 10) -> List[str]:
+        """Mengambil n baris terakhir dengan memindai file dari belakang"""
+        if n <= 0:
+            return []
+        if encoding.startswith(('utf-16', 'utf-32')):
+            return list(deque(self._iter_text_lines(file_path, encoding), maxlen=n))
+        
+        with self._map_text(file_path, encoding) as mapped:
+            if not mapped:
+                return []
+            end = len(mapped)
+            if mapped[end - 1:end] == b'\n':
+                end -= 1
             
-            return f"Teks '{old_text}' berhasil diganti dengan '{new_text}'"
+            start = end
+            for _ in range(n):
+                newline = mapped.rfind(b'\n', 0, start)
+                if newline < 0:
+                    start = 0
+                    break
+                start = newline
+            else:
+                start += 1
+            text = self._decode_text(mapped[start:end], encoding)
+        return [line.rstrip('\r') for line in text.split('\n')]
     
     def _process_docx(self, file_path: str, operation: str, **kwargs) -> Any:
         """Memproses file Word (.docx)"""
         if operation == "read":
-            doc = Document(file_path)
+            doc = Document(self._input(file_path))
             text_content = []
             for paragraph in doc.paragraphs:
                 text_content.append(paragraph.text)
@@ -114,55 +1398,313 @@ class DocumentProcessor:
             content = kwargs.get('content', '')
             doc = Document()
             doc.add_paragraph(content)
-            doc.save(file_path)
+            doc.save(self._output(file_path))
             return f"Dokumen Word {file_path} berhasil dibuat"
         
         elif operation == "append":
             content = kwargs.get('content', '')
-            doc = Document(file_path)
+            doc = Document(self._input(file_path))
             doc.add_paragraph(content)
-            doc.save(file_path)
+            doc.save(self._output(file_path))
             return f"Paragraf baru berhasil ditambahkan ke {file_path}"
         
         elif operation == "replace":
-            old_text = kwargs.get('old_text', '')
-            new_text = kwargs.get('new_text', '')
+            doc = Document(self._input(file_path))
+            count = self._docx_replace(doc, self._replacement_map(kwargs), kwargs.get('regex', False))
+            doc.save(self._output(file_path))
             
-            doc = Document(file_path)
-            for paragraph in doc.paragraphs:
-                if old_text in paragraph.text:
-                    paragraph.text = paragraph.text.replace(old_text, new_text)
+            if 'replacements' not in kwargs:
+                return f"Teks dalam dokumen Word berhasil diganti"
+            return f"{count} teks dalam dokumen Word berhasil diganti"
+        
+        elif operation == "iter_blocks":
+            return self._iter_docx_blocks(file_path, kwargs.get('types'), kwargs.get('limit'))
+    
+    def _iter_docx_blocks(self, file_path: str, block_types: Optional[Iterable[str]] = None,
+                          limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Membaca isi .docx sebagai blok bertipe langsung dari XML di dalam zip
+        
+        Blok berupa dict dengan key type ('header', 'heading', 'paragraph',
+        'table_row', 'footer', 'footnote', 'endnote') dan text, ditambah level
+        untuk heading, cells/table/row untuk baris tabel, dan id untuk catatan.
+        Urutannya mengikuti urutan baca: header, isi dokumen, footer, lalu
+        catatan kaki. Object Document tidak dibangun, jadi blok pertama tersedia
+        tanpa menunggu seluruh dokumen diparse dan iterasi bisa dihentikan kapan saja.
+        Dengan limit, zip ditutup segera setelah blok ke-limit dikembalikan.
+        """
+        wanted = set(block_types) if block_types else None
+        remaining = limit or None
+        with self._open_source(file_path, 'rb') as raw, zipfile.ZipFile(raw) as archive:
+            parts = self._docx_parts(archive)
+            levels = self._docx_heading_levels(archive)
+            order = [('header', name) for name in parts['header']] + [('body', 'word/document.xml')]
+            order += [('footer', name) for name in parts['footer']]
+            order += [(kind, name) for kind in ('footnote', 'endnote') for name in parts[kind]]
+            
+            for kind, name in order:
+                # Part yang tidak mungkin menghasilkan tipe yang diminta tidak dibuka sama sekali
+                produces = {'heading', 'paragraph', 'table_row'} if kind == 'body' else {kind, 'table_row'}
+                if wanted is not None and not wanted & produces:
+                    continue
+                with archive.open(name) as part:
+                    for block in self._iter_docx_part(part, kind, levels):
+                        if wanted is None or block['type'] in wanted:
+                            yield block
+                            if remaining is not None:
+                                remaining -= 1
+                                if remaining <= 0:
+                                    return
+    
+    def _iter_docx_part(self, part, kind: str, levels: Dict[str, int]) -> Iterator[Dict[str, Any]]:
+        """Mem-parse satu part WordprocessingML dengan iterparse dan melepas element yang sudah diproses"""
+        stack = []
+        tables = []
+        table_count = 0
+        paragraph_depth = 0
+        for event, elem in ET.iterparse(part, events=('start', 'end')):
+            tag = elem.tag
+            if event == 'start':
+                stack.append(elem)
+                if tag == _WORD_NS + 'p':
+                    paragraph_depth += 1
+                elif tag == _WORD_NS + 'tbl':
+                    tables.append([table_count, 0])
+                    table_count += 1
+                continue
+            
+            stack.pop()
+            block = None
+            if tag == _WORD_NS + 'p':
+                paragraph_depth -= 1
+                if paragraph_depth or tables or kind in ('footnote', 'endnote'):
+                    continue
+                text = self._docx_text(elem)
+                if text:
+                    block = self._docx_paragraph_block(elem, text, kind, levels)
+            elif tag == _WORD_NS + 'tr' and tables:
+                cells = [self._docx_text(cell) for cell in elem if cell.tag == _WORD_NS + 'tc']
+                block = {'type': 'table_row', 'text': '\t'.join(cells), 'cells': cells,
+                         'table': tables[-1][0], 'row': tables[-1][1]}
+                tables[-1][1] += 1
+            elif tag == _WORD_NS + 'tbl':
+                tables.pop()
+            elif tag in (_WORD_NS + 'footnote', _WORD_NS + 'endnote'):
+                # Separator bawaan Word (id -1 dan 0) bukan isi catatan
+                if elem.get(_WORD_NS + 'type') in (None, 'normal'):
+                    text = self._docx_text(elem)
+                    if text:
+                        block = {'type': kind, 'text': text, 'id': elem.get(_WORD_NS + 'id')}
+            else:
+                continue
             
-            doc.save(file_path)
-            return f"Teks dalam dokumen Word berhasil diganti"
+            if stack and not paragraph_depth:
+                stack[-1].remove(elem)
+            if block is not None:
+                yield block
+    
+    def _docx_paragraph_block(self, paragraph, text: str, kind: str, levels: Dict[str, int]) -> Dict[str, Any]:
+        if kind != 'body':
+            return {'type': kind, 'text': text}
+        
+        level = None
+        properties = paragraph.find(_WORD_NS + 'pPr')
+        if properties is not None:
+            outline = properties.find(_WORD_NS + 'outlineLvl')
+            style = properties.find(_WORD_NS + 'pStyle')
+            if outline is not None:
+                level = int(outline.get(_WORD_NS + 'val')) + 1
+            elif style is not None:
+                level = levels.get(style.get(_WORD_NS + 'val'))
+        
+        # outlineLvl 9 berarti teks biasa
+        if level is None or level > 9:
+            return {'type': 'paragraph', 'text': text}
+        return {'type': 'heading', 'text': text, 'level': level}
+    
+    def _docx_text(self, elem) -> str:
+        """Mengambil teks element WordprocessingML; paragraf dipisah baris baru"""
+        parts = []
+        pending = [elem]
+        while pending:
+            node = pending.pop()
+            if isinstance(node, str):
+                parts.append(node)
+                continue
+            tag = node.tag
+            if tag == _WORD_NS + 't':
+                parts.append(node.text or '')
+            elif tag == _WORD_NS + 'tab':
+                parts.append('\t')
+            elif tag in (_WORD_NS + 'br', _WORD_NS + 'cr'):
+                parts.append('\n')
+            elif tag in (_WORD_NS + 'pPr', _WORD_NS + 'rPr', _WORD_NS + 'delText', _MC_FALLBACK):
+                continue
+            else:
+                children = list(node)
+                if tag == _WORD_NS + 'p' and node is not elem:
+                    pending.append('\n')
+                pending.extend(reversed(children))
+        return ''.join(parts).strip('\n')
+    
+    def _docx_parts(self, archive: zipfile.ZipFile) -> Dict[str, List[str]]:
+        """Mencari part header, footer, footnotes dan endnotes dari relasi document.xml"""
+        parts = {'header': [], 'footer': [], 'footnote': [], 'endnote': []}
+        kinds = {'header': 'header', 'footer': 'footer', 'footnotes': 'footnote', 'endnotes': 'endnote'}
+        try:
+            rels = ET.fromstring(archive.read('word/_rels/document.xml.rels'))
+        except KeyError:
+            return parts
+        
+        names = set(archive.namelist())
+        for rel in rels.iter(_PACKAGE_RELS_NS + 'Relationship'):
+            kind = kinds.get(rel.get('Type', '').rsplit('/', 1)[-1])
+            target = rel.get('Target', '')
+            name = target.lstrip('/') if target.startswith('/') else 'word/' + target
+            if kind and name in names:
+                parts[kind].append(name)
+        for names_of_kind in parts.values():
+            names_of_kind.sort()
+        return parts
+    
+    def _docx_heading_levels(self, archive: zipfile.ZipFile) -> Dict[str, int]:
+        """Memetakan styleId paragraf ke level heading (Title = 0) dari word/styles.xml"""
+        try:
+            styles = ET.fromstring(archive.read('word/styles.xml'))
+        except KeyError:
+            return {}
+        
+        direct = {}
+        based_on = {}
+        for style in styles.iter(_WORD_NS + 'style'):
+            if style.get(_WORD_NS + 'type') != 'paragraph':
+                continue
+            style_id = style.get(_WORD_NS + 'styleId')
+            name = style.find(_WORD_NS + 'name')
+            name = (name.get(_WORD_NS + 'val') or '').lower() if name is not None else ''
+            outline = style.find(f'{_WORD_NS}pPr/{_WORD_NS}outlineLvl')
+            parent = style.find(_WORD_NS + 'basedOn')
+            if parent is not None:
+                based_on[style_id] = parent.get(_WORD_NS + 'val')
+            
+            match = re.fullmatch(r'heading (\d)', name)
+            if match:
+                direct[style_id] = int(match.group(1))
+            elif name == 'title':
+                direct[style_id] = 0
+            elif outline is not None:
+                direct[style_id] = int(outline.get(_WORD_NS + 'val')) + 1
+        
+        levels = {}
+        for style_id in set(direct) | set(based_on):
+            current, seen = style_id, set()
+            while current is not None and current not in direct and current not in seen:
+                seen.add(current)
+                current = based_on.get(current)
+            if current in direct and direct[current] <= 9:
+                levels[style_id] = direct[current]
+        return levels
+    
+    def _docx_replace(self, doc, replacements: Dict[str, str], regex: bool = False) -> int:
+        """Mengganti teks pada paragraf dan tabel dokumen Word yang sudah dimuat
+        
+        Penggantian dilakukan di level run sehingga format (bold, italic, dll) tetap
+        terjaga. Teks pengganti memakai format run tempat match dimulai.
+        """
+        replacer = self._compile_replacements(replacements, regex)
+        if replacer is None:
+            return 0
+        
+        count = 0
+        for paragraph in self._docx_iter_paragraphs(doc):
+            count += self._docx_replace_runs(paragraph, replacer)
+        return count
+    
+    def _docx_iter_paragraphs(self, container) -> Iterator:
+        """Mengiterasi paragraf sebuah dokumen/sel termasuk paragraf di dalam tabel"""
+        yield from container.paragraphs
+        for table in container.tables:
+            for row in table.rows:
+                for cell in row.cells:
+                    yield from self._docx_iter_paragraphs(cell)
+    
+    def _docx_replace_runs(self, paragraph, replacer: tuple) -> int:
+        """Mengganti match pada satu paragraf dengan mengubah teks run secara langsung"""
+        pattern, lookup, _ = replacer
+        runs = paragraph.runs
+        texts = [run.text for run in runs]
+        matches = list(pattern.finditer(''.join(texts)))
+        if not matches:
+            return 0
+        
+        starts = []
+        position = 0
+        for text in texts:
+            starts.append(position)
+            position += len(text)
+        
+        # Diproses dari belakang supaya offset match sebelumnya tidak bergeser
+        for match in reversed(matches):
+            start, end = match.span()
+            first = next(i for i in range(len(runs)) if starts[i] <= start < starts[i] + len(texts[i]))
+            offset = start - starts[first]
+            tail = texts[first][end - starts[first]:] if end <= starts[first] + len(texts[first]) else ''
+            texts[first] = texts[first][:offset] + lookup(match) + tail
+            
+            for i in range(first + 1, len(runs)):
+                if starts[i] >= end:
+                    break
+                texts[i] = texts[i][end - starts[i]:]
+        
+        for run, text in zip(runs, texts):
+            if run.text != text:
+                run.text = text
+        return len(matches)
     
     def _process_excel(self, file_path: str, operation: str, **kwargs) -> Any:
-        """Memproses file Excel (.xlsx)"""
+        """Memproses file Excel (.xlsx)
+        
+        Operasi read/iter_rows menerima argumen opsional: sheet (nama atau indeks;
+        untuk read juga list nama atau '*' untuk semua sheet), cell_range
+        ("A1:D100"), columns (huruf kolom, nomor kolom mulai 1, atau nama header)
+        dan data_only=True untuk membaca nilai hasil formula. Read dengan
+        columnar=True mengembalikan dict kolom -> nilai bertipe.
+        """
         if operation == "read":
-            workbook = openpyxl.load_workbook(file_path)
-            sheet = workbook.active
-            data = []
-            for row in sheet.iter_rows(values_only=True):
-                data.append(row)
-            return data
+            return self._read_excel(file_path, kwargs)
+        
+        elif operation == "iter_rows":
+            rows = self._iter_excel_rows(file_path, kwargs.get('sheet'), kwargs.get('cell_range'),
+                                         kwargs.get('columns'), kwargs.get('data_only', False))
+            return self._batch_rows(rows, kwargs.get('chunk_size'))
         
         elif operation == "write":
-            data = kwargs.get('data', [])
-            workbook = Workbook()
-            sheet = workbook.active
+            # Workbook write-only menulis baris langsung ke file sementara openpyxl,
+            # jadi data boleh berupa generator dan memori tidak bertambah per baris.
+            # sheets={'Nama': rows, ...} menulis beberapa sheet sekaligus.
+            sheets = kwargs.get('sheets') or {None: kwargs.get('data', [])}
+            workbook = Workbook(write_only=True)
             
-            for row_data in data:
-                sheet.append(row_data)
+            for title, rows in sheets.items():
+                sheet = workbook.create_sheet(title=title)
+                for row_data in rows:
+                    sheet.append(row_data)
             
-            workbook.save(file_path)
+            workbook.save(self._output(file_path))
             return f"File Excel {file_path} berhasil dibuat"
         
         elif operation == "append":
-            new_row = kwargs.get('row_data', [])
-            workbook = openpyxl.load_workbook(file_path)
+            # rows=[...] menambahkan banyak baris dengan satu kali load dan save
+            new_rows = kwargs['rows'] if 'rows' in kwargs else [kwargs.get('row_data', [])]
+            workbook = openpyxl.load_workbook(self._input(file_path))
             sheet = workbook.active
-            sheet.append(new_row)
-            workbook.save(file_path)
+            count = 0
+            for new_row in new_rows:
+                sheet.append(new_row)
+                count += 1
+            workbook.save(self._output(file_path))
+            
+            if 'rows' in kwargs:
+                return f"{count} baris berhasil ditambahkan ke {file_path}"
             return f"Baris baru berhasil ditambahkan ke {file_path}"
         
         elif operation == "update_cell":
@@ -170,85 +1712,626 @@ class DocumentProcessor:
             col = kwargs.get('col', 1)
             value = kwargs.get('value', '')
             
-            workbook = openpyxl.load_workbook(file_path)
+            workbook = openpyxl.load_workbook(self._input(file_path))
             sheet = workbook.active
             sheet.cell(row=row, column=col, value=value)
-            workbook.save(file_path)
+            workbook.save(self._output(file_path))
             return f"Cell ({row}, {col}) berhasil diupdate"
     
+    def _iter_excel_rows(self, file_path: str, sheet: Any = None, cell_range: Optional[str] = None,
+                         columns: Optional[List[Any]] = None, data_only: bool = False) -> Iterator[tuple]:
+        """Membaca baris sheet secara lazy dengan workbook mode read-only"""
+        workbook = openpyxl.load_workbook(self._input(file_path), read_only=True, data_only=data_only)
+        try:
+            yield from self._iter_sheet_rows(self._excel_sheet(workbook, sheet), cell_range, columns)
+        finally:
+            workbook.close()
+    
+    def _read_excel(self, file_path: str, kwargs: Dict[str, Any]) -> Any:
+        """Membaca satu atau beberapa sheet sebagai list baris atau output kolom"""
+        sheet = kwargs.get('sheet')
+        workbook = openpyxl.load_workbook(self._input(file_path), read_only=True,
+                                          data_only=kwargs.get('data_only', False))
+        try:
+            if sheet == '*' or isinstance(sheet, (list, tuple)):
+                names = workbook.sheetnames if sheet == '*' else sheet
+                return {name: self._excel_sheet_result(self._excel_sheet(workbook, name), kwargs) for name in names}
+            return self._excel_sheet_result(self._excel_sheet(workbook, sheet), kwargs)
+        finally:
+            workbook.close()
+    
+    def _excel_sheet_result(self, sheet, kwargs: Dict[str, Any]) -> Any:
+        rows = self._iter_sheet_rows(sheet, kwargs.get('cell_range'), kwargs.get('columns'))
+        if kwargs.get('columnar'):
+            return self._to_columns(rows, kwargs.get('header', True), kwargs.get('output', 'dict'))
+        return list(rows)
+    
+    def _excel_sheet(self, workbook, sheet: Any = None):
+        """Memilih sheet berdasarkan nama atau indeks (mulai 0), default sheet aktif"""
+        if sheet is None:
+            return workbook.active
+        if isinstance(sheet, int):
+            return workbook.worksheets[sheet]
+        if sheet not in workbook.sheetnames:
+            raise ValueError(f"Sheet {sheet} tidak ditemukan. Sheet yang tersedia: {workbook.sheetnames}")
+        return workbook[sheet]
+    
+    def _iter_sheet_rows(self, sheet, cell_range: Optional[str] = None,
+                         columns: Optional[List[Any]] = None) -> Iterator[tuple]:
+        """Mengiterasi nilai baris sheet, dibatasi rentang sel dan kolom tertentu
+        
+        Kolom berupa nomor langsung membatasi rentang kolom yang dibaca openpyxl,
+        sehingga sel di luar kolom tersebut tidak pernah dibuat. Kolom berupa
+        string dicocokkan dengan nama header dulu, baru sebagai huruf kolom.
+        """
+        bounds = {}
+        if cell_range:
+            min_col, min_row, max_col, max_row = range_boundaries(cell_range)
+            bounds = {'min_row': min_row, 'max_row': max_row, 'min_col': min_col, 'max_col': max_col}
+        first_col = bounds.get('min_col') or 1
+        
+        if not columns:
+            yield from sheet.iter_rows(values_only=True, **bounds)
+            return
+        
+        if all(isinstance(column, int) for column in columns):
+            if not cell_range:
+                bounds = {'min_col': min(columns), 'max_col': max(columns)}
+                first_col = min(columns)
+            offsets = [column - first_col for column in columns]
+            rows = sheet.iter_rows(values_only=True, **bounds)
+        else:
+            # Nama header dicocokkan lebih dulu (header "ID" atau "SKU" bukan huruf kolom);
+            # huruf kolom hanya dipakai jika tidak ada header dengan nama tersebut
+            rows = sheet.iter_rows(values_only=True, **bounds)
+            header = next(rows, None)
+            if header is None:
+                return
+            names = [str(value) if value is not None else '' for value in header]
+            offsets = []
+            for column in columns:
+                if isinstance(column, str) and column in names:
+                    offsets.append(names.index(column))
+                    continue
+                position = self._excel_column_index(column)
+                if position is None:
+                    raise ValueError(f"Kolom {column} tidak ditemukan di header: {names}")
+                offsets.append(position - first_col)
+            yield tuple(header[offset] if offset < len(header) else None for offset in offsets)
+        
+        if any(offset < 0 for offset in offsets):
+            raise ValueError(f"Kolom {columns} berada di luar rentang {cell_range}")
+        for row in rows:
+            yield tuple(row[offset] if offset < len(row) else None for offset in offsets)
+    
+    def _excel_column_index(self, column: Any) -> Optional[int]:
+        """Mengubah huruf kolom ("C" atau "c") atau nomor (3) menjadi indeks mulai 1, None jika bukan keduanya"""
+        if isinstance(column, int):
+            return column
+        if isinstance(column, str) and re.fullmatch(r'[A-Za-z]{1,3}', column):
+            return column_index_from_string(column.upper())
+        return None
+    
+    def _to_columns(self, rows: Iterable, header: bool = True, output: str = 'dict') -> Any:
+        """Mengubah baris menjadi output per kolom dengan tipe seragam
+        
+        Kolom yang seluruh nilainya int disimpan sebagai array('q'), campuran
+        int/float sebagai array('d'), selain itu tetap list. output='numpy'
+        menghasilkan dict numpy array dan output='pandas' menghasilkan DataFrame.
+        """
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            return {}
+        
+        if header:
+            names = [str(value) if value is not None else f"kolom_{i + 1}" for i, value in enumerate(first)]
+            values = [[] for _ in names]
+        else:
+            names = [get_column_letter(i + 1) for i in range(len(first))]
+            values = [[value] for value in first]
+        
+        for row in rows:
+            for i, column_values in enumerate(values):
+                column_values.append(row[i] if i < len(row) else None)
+        
+        columns = {name: self._typed_column(column_values) for name, column_values in zip(names, values)}
+        
+        if output == 'numpy':
+            try:
+                import numpy
+            except ImportError:
+                raise ImportError("Install numpy: pip install numpy")
+            return {name: numpy.asarray(column_values) for name, column_values in columns.items()}
+        if output == 'pandas':
+            try:
+                import pandas
+            except ImportError:
+                raise ImportError("Install pandas: pip install pandas")
+            return pandas.DataFrame({name: list(column_values) for name, column_values in columns.items()})
+        return columns
+    
+    def _typed_column(self, values: List[Any]) -> Any:
+        """Mengemas nilai kolom ke array bertipe jika semuanya angka"""
+        if values and all(type(value) is int for value in values):
+            try:
+                return array('q', values)
+            except OverflowError:
+                return values
+        if values and all(type(value) in (int, float) for value in values):
+            return array('d', values)
+        return values
+    
     def _process_csv(self, file_path: str, operation: str, **kwargs) -> Any:
-        """Memproses file CSV"""
-        if operation == "read":
-            data = []
-            with open(file_path, 'r', encoding='utf-8') as file:
-                csv_reader = csv.reader(file)
-                for row in csv_reader:
-                    data.append(row)
-            return data
+        """Memproses file CSV
+        
+        Operasi read/iter_rows menerima argumen opsional: encoding dan dialect
+        (default dideteksi dari sampel awal file), columns (nama header atau
+        indeks mulai 0), types (True untuk inferensi int/float/date, atau dict
+        kolom -> 'int'/'float'/'date'/callable) dan header (default True).
+        columnar=True menghasilkan dict kolom -> nilai bertipe; pada iter_rows
+        setiap batch chunk_size dikirim dalam bentuk kolom.
+        """
+        if operation in ("read", "iter_rows"):
+            rows = self._iter_csv_rows(file_path, kwargs.get('encoding'), kwargs.get('dialect'),
+                                       kwargs.get('columns'), kwargs.get('types'), kwargs.get('header', True))
+            if operation == "iter_rows":
+                if kwargs.get('columnar'):
+                    return self._columnar_batches(rows, kwargs.get('header', True), kwargs.get('chunk_size') or 10000)
+                return self._batch_rows(rows, kwargs.get('chunk_size'))
+            if kwargs.get('columnar'):
+                return self._to_columns(rows, kwargs.get('header', True), kwargs.get('output', 'dict'))
+            return list(rows)
         
         elif operation == "write":
             data = kwargs.get('data', [])
-            with open(file_path, 'w', newline='', encoding='utf-8') as file:
+            with self._open_source(file_path, 'w', newline='', encoding='utf-8') as file:
                 csv_writer = csv.writer(file)
                 csv_writer.writerows(data)
             return f"File CSV {file_path} berhasil dibuat"
         
         elif operation == "append":
-            new_row = kwargs.get('row_data', [])
-            with open(file_path, 'a', newline='', encoding='utf-8') as file:
-                csv_writer = csv.writer(file)
-                csv_writer.writerow(new_row)
+            # rows=[...] menambahkan banyak baris dengan satu kali buka file
+            new_rows = kwargs['rows'] if 'rows' in kwargs else [kwargs.get('row_data', [])]
+            count = 0
+            # Baris baru mengikuti encoding dan delimiter file yang sudah ada
+            encoding, dialect = 'utf-8', 'excel'
+            if self._source_size(file_path) > 0:
+                encoding, dialect = self._csv_format(file_path, kwargs.get('encoding'), kwargs.get('dialect'))
+                if encoding == 'utf-8-sig':
+                    encoding = 'utf-8'
+            with self._open_source(file_path, 'a', newline='', encoding=encoding) as file:
+                csv_writer = csv.writer(file, dialect)
+                for new_row in new_rows:
+                    csv_writer.writerow(new_row)
+                    count += 1
+            
+            if 'rows' in kwargs:
+                return f"{count} baris berhasil ditambahkan ke CSV"
             return f"Baris baru berhasil ditambahkan ke CSV"
     
+    def _iter_csv_rows(self, file_path: str, encoding: Optional[str] = None, dialect: Any = None,
+                       columns: Optional[List[Any]] = None, column_types: Any = None,
+                       header: bool = True) -> Iterator[list]:
+        """Membaca baris CSV satu per satu tanpa menampung seluruh file"""
+        encoding, dialect = self._csv_format(file_path, encoding, dialect)
+        with self._open_source(file_path, 'r', newline='', encoding=encoding) as file:
+            reader = csv.reader(file, dialect)
+            if not columns and not column_types:
+                yield from reader
+                return
+            
+            names = next(reader, None) if header else None
+            if header and names is None:
+                return
+            
+            indexes = None
+            if columns:
+                indexes = [self._csv_column_index(column, names) for column in columns]
+                if names is not None:
+                    names = [names[index] if index < len(names) else '' for index in indexes]
+            if names is not None:
+                yield names
+            
+            rows = reader
+            if indexes is not None:
+                rows = ([row[index] if index < len(row) else '' for index in indexes] for row in reader)
+            if not column_types:
+                yield from rows
+                return
+            
+            # Tipe kolom ditebak dari sampel baris pertama, lalu sampel ikut dikonversi
+            sample = list(islice(rows, 1000))
+            width = max((len(row) for row in sample), default=len(names or []))
+            converters = self._csv_converters(column_types, names, width, sample)
+            for row in sample:
+                yield self._convert_csv_row(row, converters)
+            for row in rows:
+                yield self._convert_csv_row(row, converters)
+    
+    def _csv_format(self, file_path: str, encoding: Optional[str] = None, dialect: Any = None) -> tuple:
+        """Menentukan encoding dan dialect CSV dari satu sampel awal file
+        
+        Default-nya dialect excel, sama dengan yang dipakai write, sehingga file
+        yang ditulis processor selalu terbaca ulang apa adanya. Delimiter lain
+        hanya dipakai jika dialect='auto', atau jika pemisahan dengan koma
+        menghasilkan jumlah kolom yang tidak konsisten sedangkan delimiter lain
+        (; tab |) konsisten, misalnya file titik koma dengan angka desimal koma.
+        Dari hasil sniffing hanya delimiter yang dipakai, quoting tetap excel.
+        """
+        if encoding is not None and (dialect is not None and dialect != 'auto'):
+            return encoding, dialect
+        
+        with self._open_source(file_path, 'rb') as file:
+            raw = file.read(64 * 1024)
+            truncated = bool(file.read(1))
+        if encoding is None:
+            encoding = self._sample_encoding(raw)
+        if dialect is not None and dialect != 'auto':
+            return encoding, dialect
+        
+        sample = codecs.getincrementaldecoder(encoding)(errors='replace').decode(raw, final=not truncated)
+        if truncated and '\n' in sample:
+            # Baris terakhir sampel mungkin terpotong
+            sample = sample[:sample.rindex('\n') + 1]
+        
+        if dialect == 'auto':
+            return encoding, self._csv_dialect(self._sniff_csv_delimiter(sample))
+        if self._csv_consistent(sample, ','):
+            return encoding, 'excel'
+        
+        # Sniffer hanya dijalankan jika koma tidak menghasilkan kolom yang konsisten
+        sniffed = self._sniff_csv_delimiter(sample)
+        for delimiter in [sniffed] + [delimiter for delimiter in ';\t|' if delimiter != sniffed]:
+            if delimiter and delimiter != ',' and self._csv_consistent(sample, delimiter):
+                return encoding, self._csv_dialect(delimiter)
+        return encoding, 'excel'
+    
+    def _csv_consistent(self, sample: str, delimiter: str) -> bool:
+        """True jika semua baris sampel (maks. 100) punya jumlah kolom yang sama, lebih dari satu"""
+        try:
+            rows = list(islice(csv.reader(io.StringIO(sample), delimiter=delimiter), 100))
+        except csv.Error:
+            return False
+        widths = {len(row) for row in rows if row}
+        if not widths:
+            return delimiter == ','
+        return len(widths) == 1 and widths.pop() > 1
+    
+    def _sniff_csv_delimiter(self, sample: str) -> Optional[str]:
+        """Delimiter hasil csv.Sniffer (, ; tab |), atau None jika tidak terdeteksi"""
+        try:
+            return csv.Sniffer().sniff(sample, delimiters=',;\t|').delimiter
+        except csv.Error:
+            return None
+    
+    def _csv_dialect(self, delimiter: Optional[str]) -> Any:
+        """Dialect excel dengan delimiter tertentu"""
+        if delimiter in (None, ','):
+            return 'excel'
+        return type('SniffedDialect', (csv.excel,), {'delimiter': delimiter})
+    
+    def _csv_column_index(self, column: Any, names: Optional[List[str]]) -> int:
+        if isinstance(column, int):
+            return column
+        if names is None or column not in names:
+            raise ValueError(f"Kolom {column} tidak ditemukan di header: {names}")
+        return names.index(column)
+    
+    def _csv_converters(self, column_types: Any, names: Optional[List[str]], width: int,
+                        sample: List[list]) -> List[Any]:
+        """Menyusun fungsi konversi per kolom dari types atau hasil inferensi sampel"""
+        parsers = {'int': int, 'float': float, 'date': datetime.date.fromisoformat, 'str': None}
+        converters = []
+        for index in range(width):
+            if column_types is True:
+                kind = self._infer_csv_type(row[index] for row in sample if index < len(row))
+            else:
+                name = names[index] if names and index < len(names) else None
+                kind = column_types.get(name, column_types.get(index))
+            converters.append(parsers.get(kind, kind) if not callable(kind) else kind)
+        return converters
+    
+    def _infer_csv_type(self, values: Iterable[str]) -> str:
+        """Menebak tipe kolom: int, float, date, atau str jika ada nilai yang tidak cocok"""
+        candidates = ['int', 'float', 'date']
+        seen = False
+        for value in values:
+            if value == '':
+                continue
+            seen = True
+            if 'int' in candidates and not re.fullmatch(r'[+-]?\d+', value):
+                candidates.remove('int')
+            if 'float' in candidates:
+                try:
+                    float(value)
+                except ValueError:
+                    candidates.remove('float')
+            if 'date' in candidates and not re.fullmatch(r'\d{4}-\d{2}-\d{2}', value):
+                candidates.remove('date')
+            if not candidates:
+                break
+        return candidates[0] if seen and candidates else 'str'
+    
+    def _convert_csv_row(self, row: list, converters: List[Any]) -> list:
+        """Mengonversi nilai satu baris; sel kosong menjadi None, nilai yang gagal dikonversi dibiarkan string"""
+        converted = []
+        for index, value in enumerate(row):
+            converter = converters[index] if index < len(converters) else None
+            if converter is None:
+                converted.append(value)
+            elif value == '':
+                converted.append(None)
+            else:
+                try:
+                    converted.append(converter(value))
+                except ValueError:
+                    converted.append(value)
+        return converted
+    
+    def _columnar_batches(self, rows: Iterator[list], header: bool, chunk_size: int) -> Iterator[Dict[str, Any]]:
+        """Mengelompokkan baris menjadi batch berbentuk kolom (array bertipe bila numerik)"""
+        rows = iter(rows)
+        names = None
+        if header:
+            first = next(rows, None)
+            if first is None:
+                return
+            names = [str(value) if value is not None else f"kolom_{i + 1}" for i, value in enumerate(first)]
+        
+        while True:
+            batch = list(islice(rows, chunk_size))
+            if not batch:
+                return
+            if names is None:
+                names = [f"kolom_{i + 1}" for i in range(len(batch[0]))]
+            values = [[row[i] if i < len(row) else None for row in batch] for i in range(len(names))]
+            yield {name: self._typed_column(column_values) for name, column_values in zip(names, values)}
+    
     def _process_json(self, file_path: str, operation: str, **kwargs) -> Any:
         """Memproses file JSON"""
         if operation == "read":
-            with open(file_path, 'r', encoding='utf-8') as file:
+            with self._open_source(file_path, 'r', encoding='utf-8') as file:
                 return json.load(file)
         
         elif operation == "write":
-            data = kwargs.get('data', {})
-            with open(file_path, 'w', encoding='utf-8') as file:
-                json.dump(data, file, indent=2, ensure_ascii=False)
+            # records=<iterable> atau data berupa generator ditulis sebagai array JSON secara bertahap
+            data = kwargs['records'] if 'records' in kwargs else kwargs.get('data', {})
+            compact = kwargs.get('compact', False)
+            with self._open_source(file_path, 'w', encoding='utf-8') as file:
+                if 'records' in kwargs or isinstance(data, Iterator):
+                    self._write_buffered(file, self._json_array_pieces(data, compact),
+                                         kwargs.get('buffer_size', 1024 * 1024))
+                elif compact:
+                    json.dump(data, file, ensure_ascii=False, separators=(',', ':'))
+                else:
+                    json.dump(data, file, indent=2, ensure_ascii=False)
             return f"File JSON {file_path} berhasil dibuat"
         
+        elif operation == "query":
+            return self._json_query(file_path, kwargs.get('key', ''), kwargs.get('default'))
+        
         elif operation == "update":
-            key = kwargs.get('key', '')
-            value = kwargs.get('value', '')
+            # updates={key: value} memperbarui banyak key dengan satu kali parse dan tulis
+            updates = kwargs.get('updates') or {kwargs.get('key', ''): kwargs.get('value', '')}
             
-            with open(file_path, 'r', encoding='utf-8') as file:
+            with self._open_source(file_path, 'r', encoding='utf-8') as file:
                 data = json.load(file)
             
-            # Update nested keys dengan dot notation
-            keys = key.split('.')
-            current = data
-            for k in keys[:-1]:
-                if k not in current:
-                    current[k] = {}
-                current = current[k]
-            current[keys[-1]] = value
+            for key, value in updates.items():
+                self._json_set_key(data, key, value)
             
-            with open(file_path, 'w', encoding='utf-8') as file:
+            with self._open_source(file_path, 'w', encoding='utf-8') as file:
                 json.dump(data, file, indent=2, ensure_ascii=False)
             
-            return f"Key '{key}' berhasil diupdate"
+            if 'updates' in kwargs:
+                return f"{len(updates)} key berhasil diupdate"
+            return f"Key '{kwargs.get('key', '')}' berhasil diupdate"
+    
+    def _json_set_key(self, data: Dict, key: str, value: Any):
+        """Update nested keys dengan dot notation pada data JSON yang sudah dimuat"""
+        keys = key.split('.')
+        current = data
+        for k in keys[:-1]:
+            if k not in current:
+                current[k] = {}
+            current = current[k]
+        current[keys[-1]] = value
+    
+    def _json_query(self, file_path: str, key: str, default: Any = None) -> Any:
+        """Mengambil nilai pada key dot notation (misalnya a.b.0.c) tanpa mem-parse seluruh file
+        
+        File dipetakan dengan mmap dan dipindai per byte; nilai yang tidak berada
+        di jalur key hanya dilewati, hanya nilai target yang di-parse.
+        """
+        if self._is_stream(file_path):
+            with self._open_source(file_path, 'rb') as file:
+                return self._json_query_buffer(file.read(), key, default)
+        
+        with open(file_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return default
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                return self._json_query_buffer(buffer, key, default)
+    
+    def _json_query_buffer(self, buffer, key: str, default: Any = None) -> Any:
+        """Menjalankan query dot notation pada buffer byte JSON (bytes atau mmap)
+        
+        Setiap container di jalur key dipindai sampai penutupnya, jadi JSON yang
+        terpotong atau rusak ditolak dengan ValueError seperti json.load, dan
+        untuk key ganda nilai terakhir yang dipakai.
+        """
+        if not buffer:
+            return default
+        start = 3 if buffer[0:3] == codecs.BOM_UTF8 else 0
+        position = _JSON_WHITESPACE.match(buffer, start).end()
+        
+        target = None
+        root_end = None
+        for part in (key.split('.') if key else []):
+            target, end = self._json_find_child(buffer, position, part)
+            if root_end is None:
+                root_end = end
+            if target is None:
+                break
+            position = target[0]
+        else:
+            if target is None:
+                target = (position, self._json_skip_value(buffer, position))
+                root_end = target[1]
+        
+        trailing = _JSON_WHITESPACE.match(buffer, root_end).end()
+        if trailing != len(buffer):
+            raise self._json_error("data tambahan setelah nilai JSON", trailing)
+        if target is None:
+            return default
+        return json.loads(buffer[target[0]:target[1]].decode('utf-8'))
+    
+    def _json_find_child(self, buffer, position: int, part: str) -> tuple:
+        """Mencari nilai anak bernama part (key object atau indeks array)
+        
+        Mengembalikan ((awal, akhir) nilai atau None, posisi setelah container).
+        """
+        opener = buffer[position:position + 1]
+        if opener not in (b'{', b'['):
+            return None, self._json_skip_value(buffer, position)
+        
+        closer = b'}' if opener == b'{' else b']'
+        index = int(part) if opener == b'[' and part.isdigit() else None
+        found = None
+        count = 0
+        position = _JSON_WHITESPACE.match(buffer, position + 1).end()
+        if buffer[position:position + 1] == closer:
+            return None, position + 1
+        
+        while True:
+            if opener == b'{':
+                key_match = _JSON_STRING.match(buffer, position)
+                if key_match is None:
+                    raise self._json_error("key object harus berupa string", position)
+                name = json.loads(key_match.group().decode('utf-8'))
+                position = _JSON_WHITESPACE.match(buffer, key_match.end()).end()
+                if buffer[position:position + 1] != b':':
+                    raise self._json_error("':' tidak ditemukan setelah key", position)
+                position = _JSON_WHITESPACE.match(buffer, position + 1).end()
+                matched = name == part
+            else:
+                matched = count == index
+            
+            end = self._json_skip_value(buffer, position)
+            if matched:
+                # Key ganda: yang terakhir menimpa, sama seperti json.load
+                found = (position, end)
+            position = _JSON_WHITESPACE.match(buffer, end).end()
+            char = buffer[position:position + 1]
+            if char == closer:
+                return found, position + 1
+            if char != b',':
+                raise self._json_error(f"',' atau '{closer.decode()}' tidak ditemukan", position)
+            position = _JSON_WHITESPACE.match(buffer, position + 1).end()
+            count += 1
+    
+    def _json_skip_value(self, buffer, position: int) -> int:
+        """Mengembalikan posisi byte setelah nilai JSON yang dimulai di position"""
+        opener = buffer[position:position + 1]
+        if opener == b'"':
+            match = _JSON_STRING.match(buffer, position)
+            if match is None:
+                raise self._json_error("string tidak ditutup", position)
+            return match.end()
+        
+        if opener in (b'{', b'['):
+            closers = []
+            for token in _JSON_STRUCTURE.finditer(buffer, position):
+                char = token.group()
+                if char == b'{':
+                    closers.append(b'}')
+                elif char == b'[':
+                    closers.append(b']')
+                elif char in (b'}', b']'):
+                    if closers.pop() != char:
+                        raise self._json_error("kurung penutup tidak cocok", token.start())
+                    if not closers:
+                        return token.end()
+            raise self._json_error("struktur JSON tidak lengkap", len(buffer))
+        
+        match = _JSON_SCALAR.match(buffer, position)
+        if match is None:
+            raise self._json_error("nilai tidak ditemukan", position)
+        return match.end()
+    
+    def _json_error(self, message: str, position: int) -> ValueError:
+        return ValueError(f"JSON tidak valid di byte {position}: {message}")
+    
+    def _process_jsonl(self, file_path: str, operation: str, **kwargs) -> Any:
+        """Memproses file JSON Lines (.jsonl), satu objek JSON per baris"""
+        if operation == "read":
+            return list(self._iter_jsonl_records(file_path))
+        
+        elif operation == "iter_rows":
+            return self._batch_rows(self._iter_jsonl_records(file_path), kwargs.get('chunk_size'))
+        
+        elif operation == "write":
+            data = kwargs['records'] if 'records' in kwargs else kwargs.get('data', [])
+            separators = (',', ':') if kwargs.get('compact') else None
+            encode = json.JSONEncoder(ensure_ascii=False, separators=separators).encode
+            with self._open_source(file_path, 'w', encoding='utf-8') as file:
+                self._write_buffered(file, (encode(record) + '\n' for record in data),
+                                     kwargs.get('buffer_size', 1024 * 1024))
+            return f"File JSON Lines {file_path} berhasil dibuat"
+        
+        elif operation == "append":
+            # rows=[...] menambahkan banyak record sekaligus dengan satu kali buka file
+            records = kwargs['rows'] if 'rows' in kwargs else [kwargs.get('row_data', {})]
+            count = 0
+            with self._open_source(file_path, 'a', encoding='utf-8') as file:
+                for record in records:
+                    file.write(json.dumps(record, ensure_ascii=False) + '\n')
+                    count += 1
+            
+            if 'rows' in kwargs:
+                return f"{count} record berhasil ditambahkan ke {file_path}"
+            return f"Record baru berhasil ditambahkan ke {file_path}"
+    
+    def _iter_jsonl_records(self, file_path: str) -> Iterator[Any]:
+        """Membaca record JSON Lines satu per satu, baris kosong dilewati"""
+        with self._open_source(file_path, 'r', encoding='utf-8') as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
     
     def _process_xml(self, file_path: str, operation: str, **kwargs) -> Any:
         """Memproses file XML"""
         if operation == "read":
-            tree = ET.parse(file_path)
+            tree = ET.parse(self._input(file_path))
             root = tree.getroot()
             return ET.tostring(root, encoding='unicode')
         
+        elif operation == "iter":
+            # tag: element dengan nama tsb di kedalaman mana pun, path: "a/b" relatif terhadap root
+            if kwargs.get('path'):
+                parts = [p for p in kwargs['path'].split('/') if p and p != '.']
+                matcher = lambda stack: stack[1:] == parts
+            else:
+                # Tanpa tag: semua element di bawah root (root sendiri akan memuat seluruh dokumen)
+                tag = kwargs.get('tag')
+                matcher = lambda stack: len(stack) > 1 and (tag is None or stack[-1] == tag)
+            return self._batch_rows(self._iter_xml_elements(file_path, matcher), kwargs.get('chunk_size'))
+        
+        elif operation == "query":
+            return self._xml_query(file_path, kwargs.get('xpath', '.'), kwargs.get('limit'))
+        
         elif operation == "write":
+            # records=<iterable> atau data berupa generator menjadi element item_name berurutan di bawah root
             root_name = kwargs.get('root_name', 'root')
-            data = kwargs.get('data', {})
+            data = kwargs['records'] if 'records' in kwargs else kwargs.get('data', {})
             
-            root = ET.Element(root_name)
-            self._dict_to_xml(data, root)
-            
-            tree = ET.ElementTree(root)
-            tree.write(file_path, encoding='utf-8', xml_declaration=True)
+            if 'records' in kwargs or isinstance(data, Iterator):
+                pieces = self._xml_document_pieces(root_name, records=data, item_name=kwargs.get('item_name', 'item'))
+            else:
+                pieces = self._xml_document_pieces(root_name, data)
+            with self._open_source(file_path, 'w', encoding='utf-8') as file:
+                self._write_buffered(file, pieces, kwargs.get('buffer_size', 1024 * 1024))
             return f"File XML {file_path} berhasil dibuat"
         
         elif operation == "add_element":
@@ -256,40 +2339,436 @@ class DocumentProcessor:
             element_name = kwargs.get('element_name', 'new_element')
             element_text = kwargs.get('element_text', '')
             
-            tree = ET.parse(file_path)
-            root = tree.getroot()
+            tree = ET.parse(self._input(file_path))
             
-            parent = root.find(parent_xpath)
-            if parent is not None:
-                new_element = ET.SubElement(parent, element_name)
-                new_element.text = element_text
-                
-                tree.write(file_path, encoding='utf-8', xml_declaration=True)
+            if self._xml_add_element(tree.getroot(), parent_xpath, element_name, element_text):
+                tree.write(self._output(file_path), encoding='utf-8', xml_declaration=True)
                 return f"Element '{element_name}' berhasil ditambahkan"
             else:
                 return f"Parent element tidak ditemukan: {parent_xpath}"
     
+    def _xml_add_element(self, root: ET.Element, parent_xpath: str, element_name: str, element_text: str) -> bool:
+        """Menambahkan element baru di bawah parent_xpath, False jika parent tidak ada"""
+        parent = root.find(parent_xpath)
+        if parent is None:
+            return False
+        new_element = ET.SubElement(parent, element_name)
+        new_element.text = element_text
+        return True
+    
+    def _iter_xml_elements(self, file_path: str, matcher) -> Iterator[ET.Element]:
+        """Mengiterasi element XML yang cocok dengan iterparse, memori tetap terbatas
+        
+        matcher menerima daftar nama tag dari root sampai element saat ini. Match
+        dikembalikan sesuai urutan dokumen (urutan tag pembuka) dengan subtree
+        utuh; match yang bersarang di dalam match lain ikut dikembalikan setelah
+        match terluarnya selesai. Element yang sudah selesai dan tidak berada di
+        dalam match terbuka dilepas dari parent-nya, sehingga tree di memori
+        tidak tumbuh selama file dibaca.
+        """
+        with self._open_source(file_path, 'rb') as file:
+            stack = []
+            elements = []
+            pending = []
+            open_matches = 0
+            for event, elem in ET.iterparse(file, events=('start', 'end')):
+                if event == 'start':
+                    stack.append(elem.tag)
+                    elements.append(elem)
+                    if matcher(stack):
+                        open_matches += 1
+                        pending.append(elem)
+                    continue
+                
+                if matcher(stack):
+                    open_matches -= 1
+                
+                stack.pop()
+                elements.pop()
+                if open_matches:
+                    # Masih di dalam match terluar: subtree harus tetap utuh
+                    continue
+                
+                yield from pending
+                pending.clear()
+                if elements:
+                    elements[-1].remove(elem)
+    
+    def _xml_query(self, file_path: str, xpath: str, limit: Optional[int] = None) -> List[str]:
+        """Mengembalikan subtree yang cocok dengan xpath sebagai string XML
+        
+        Path sederhana ("a/b", ".//tag") dijawab secara streaming; XPath lain
+        (predikat, namespace, dll) memakai ET.parse dan findall.
+        """
+        descendant = _XML_DESCENDANT_TAG.fullmatch(xpath)
+        simple = _XML_SIMPLE_PATH.fullmatch(xpath)
+        
+        if descendant:
+            tag = descendant.group(1)
+            elements = self._iter_xml_elements(file_path, lambda stack: len(stack) > 1 and stack[-1] == tag)
+        elif simple:
+            parts = simple.group(1).split('/')
+            elements = self._iter_xml_elements(file_path, lambda stack: stack[1:] == parts)
+        else:
+            elements = ET.parse(self._input(file_path)).getroot().iterfind(xpath)
+        
+        results = []
+        for elem in islice(elements, limit):
+            results.append(ET.tostring(elem, encoding='unicode'))
+        if hasattr(elements, 'close'):
+            elements.close()
+        return results
+    
     def _process_pdf(self, file_path: str, operation: str, **kwargs) -> Any:
-        """Memproses file PDF (hanya baca untuk sekarang)"""
+        """Memproses file PDF (hanya baca untuk sekarang)
+        
+        Parameter opsional: pages (indeks halaman mulai 0, misalnya range(0, 5))
+        dan workers (jumlah process untuk ekstraksi paralel per potongan halaman).
+        """
+        pages = kwargs.get('pages')
+        workers = kwargs.get('workers', 1)
+        
         if operation == "read":
-            reader = PdfReader(file_path)
-            text_content = []
-            for page in reader.pages:
-                text_content.append(page.extract_text())
-            return '\n'.join(text_content)
+            return '\n'.join(self._iter_pdf_pages(file_path, pages, workers))
+        
+        elif operation in ("iter_pages", "iter_rows"):
+            return self._iter_pdf_pages(file_path, pages, workers)
         
         else:
             return "Operasi PDF terbatas pada pembacaan saja"
     
+    def _iter_pdf_pages(self, file_path: str, pages: Optional[Iterable[int]] = None,
+                        workers: int = 1) -> Iterator[str]:
+        """Mengekstrak teks halaman PDF satu per satu sesuai urutan halaman"""
+        reader = PdfReader(self._input(file_path))
+        total_pages = len(reader.pages)
+        if pages is None:
+            page_indices = list(range(total_pages))
+        else:
+            page_indices = [i for i in pages if 0 <= i < total_pages]
+        
+        # Stream tidak bisa dikirim ke worker process, jadi diekstrak di process ini
+        if workers <= 1 or len(page_indices) < 2 or self._is_stream(file_path):
+            for i in page_indices:
+                yield reader.pages[i].extract_text()
+            return
+        
+        # Bagi halaman menjadi potongan berurutan, satu potongan per tugas worker
+        slice_size = max(1, -(-len(page_indices) // (workers * 4)))
+        slices = [page_indices[i:i + slice_size] for i in range(0, len(page_indices), slice_size)]
+        # Hanya sejumlah kecil potongan yang dikirim sekaligus, sehingga iterasi yang
+        # dihentikan lebih awal tidak menunggu seluruh dokumen selesai diekstrak
+        from concurrent.futures import ProcessPoolExecutor
+        pool = ProcessPoolExecutor(max_workers=workers)
+        pending = deque()
+        remaining = iter(slices)
+        try:
+            for page_slice in islice(remaining, workers * 2):
+                pending.append(pool.submit(_extract_pdf_pages, file_path, page_slice))
+            while pending:
+                texts = pending.popleft().result()
+                for page_slice in islice(remaining, 1):
+                    pending.append(pool.submit(_extract_pdf_pages, file_path, page_slice))
+                yield from texts
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+    
     def _dict_to_xml(self, data: Dict, parent: ET.Element):
-        """Helper untuk mengkonversi dictionary ke XML"""
-        for key, value in data.items():
+        """Helper untuk mengkonversi dictionary ke XML
+        
+        Diproses secara iteratif sehingga kedalaman nesting tidak dibatasi
+        recursion limit. List menjadi element berulang dengan tag yang sama
+        (kebalikan _xml_to_dict); list di dalam list dibungkus element 'item'.
+        """
+        pending = [(data, parent)]
+        while pending:
+            data, parent = pending.pop()
+            for key, value in data.items():
+                for item in (value if isinstance(value, (list, tuple)) else [value]):
+                    child = ET.SubElement(parent, key)
+                    if isinstance(item, (list, tuple)):
+                        item = {'item': item}
+                    if isinstance(item, dict):
+                        pending.append((item, child))
+                    else:
+                        child.text = str(item)
+    
+    def _xml_pieces(self, tag: str, value: Any) -> Iterator[str]:
+        """Menghasilkan potongan string XML untuk value di bawah tag tanpa membangun ElementTree
+        
+        Aturannya sama dengan _dict_to_xml dan hasilnya identik dengan
+        ET.tostring, tetapi iteratif dan tanpa object Element per node.
+        """
+        pending = [(tag, value)]
+        while pending:
+            tag, value = pending.pop()
+            if tag is None:
+                # Penanda tag penutup
+                yield value
+                continue
+            if isinstance(value, (list, tuple)):
+                value = {'item': value}
             if isinstance(value, dict):
-                child = ET.SubElement(parent, key)
-                self._dict_to_xml(value, child)
+                children = []
+                for key, child in value.items():
+                    if isinstance(child, (list, tuple)):
+                        children.extend((key, item) for item in child)
+                    else:
+                        children.append((key, child))
+                if not children:
+                    yield f"<{tag} />"
+                    continue
+                yield f"<{tag}>"
+                pending.append((None, f"</{tag}>"))
+                pending.extend(reversed(children))
+            else:
+                text = _xml_escape(str(value))
+                yield f"<{tag}>{text}</{tag}>" if text else f"<{tag} />"
+    
+    def _xml_document_pieces(self, root_name: str, data: Optional[Dict] = None, records: Optional[Iterable] = None,
+                             item_name: str = 'item') -> Iterator[str]:
+        """Potongan dokumen XML lengkap: dari dict data, atau dari records yang ditulis satu per satu"""
+        yield "<?xml version='1.0' encoding='utf-8'?>\n"
+        if records is None:
+            yield from self._xml_pieces(root_name, data or {})
+            return
+        
+        started = False
+        for record in records:
+            if not started:
+                yield f"<{root_name}>"
+                started = True
+            yield from self._xml_pieces(item_name, record)
+        yield f"</{root_name}>" if started else f"<{root_name} />"
+    
+    def _json_array_pieces(self, records: Iterable, compact: bool = False, default=None) -> Iterator[str]:
+        """Potongan array JSON dari records; format indent sama dengan json.dump(list, indent=2)"""
+        if compact:
+            encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), default=default).encode
+            separator, opening, closing = ',', '[', ']'
+        else:
+            indent_encode = json.JSONEncoder(ensure_ascii=False, indent=2, default=default).encode
+            encode = lambda record: indent_encode(record).replace('\n', '\n  ')
+            separator, opening, closing = ',\n  ', '[\n  ', '\n]'
+        
+        started = False
+        for record in records:
+            yield (separator if started else opening) + encode(record)
+            started = True
+        yield closing if started else '[]'
+    
+    def _write_buffered(self, file, pieces: Iterable[str], buffer_size: int = 1024 * 1024):
+        """Menulis potongan string ke file per blok sekitar buffer_size karakter"""
+        buffer = []
+        size = 0
+        for piece in pieces:
+            buffer.append(piece)
+            size += len(piece)
+            if size >= buffer_size:
+                file.write(''.join(buffer))
+                buffer.clear()
+                size = 0
+        if buffer:
+            file.write(''.join(buffer))
+    
+    def _counted(self, items: Iterable) -> '_CountingIterator':
+        return _CountingIterator(items)
+    
+    def _xml_to_dict(self, element: ET.Element) -> Any:
+        """Helper untuk mengkonversi element XML ke dictionary (kebalikan _dict_to_xml)
+        
+        Element tanpa anak menjadi teksnya; tag anak yang berulang menjadi list.
+        """
+        children = list(element)
+        if not children:
+            return element.text or ''
+        
+        result = {}
+        for child in children:
+            value = self._xml_to_dict(child)
+            if child.tag in result:
+                if not isinstance(result[child.tag], list):
+                    result[child.tag] = [result[child.tag]]
+                result[child.tag].append(value)
             else:
-                child = ET.SubElement(parent, key)
-                child.text = str(value)
+                result[child.tag] = value
+        return result
+
+
+class _CountingIterator:
+    """Iterator pembungkus yang menghitung jumlah item yang sudah lewat"""
+    
+    def __init__(self, items: Iterable):
+        self._items = iter(items)
+        self.count = 0
+    
+    def __iter__(self) -> '_CountingIterator':
+        return self
+    
+    def __next__(self) -> Any:
+        item = next(self._items)
+        self.count += 1
+        return item
+
+
+class EditSession:
+    """Sesi edit dokumen: file di-parse sekali, disimpan sekali secara atomik saat keluar
+    
+    Perubahan ditulis ke file sementara di folder yang sama lalu di-rename ke
+    file asli. Jika terjadi exception di dalam blok with, file tidak diubah.
+    """
+    
+    EDITABLE_FORMATS = ('.docx', '.xlsx', '.json', '.xml')
+    
+    def __init__(self, processor: DocumentProcessor, file_path: str, doc_type: str):
+        self.processor = processor
+        self.file_path = file_path
+        self.doc_type = doc_type
+        self.document = None
+        self.changes = 0
+    
+    def __enter__(self) -> 'EditSession':
+        if self.doc_type == '.docx':
+            self.document = Document(self.file_path)
+        elif self.doc_type == '.xlsx':
+            self.document = openpyxl.load_workbook(self.file_path)
+        elif self.doc_type == '.json':
+            with open(self.file_path, 'r', encoding='utf-8') as file:
+                self.document = json.load(file)
+        elif self.doc_type == '.xml':
+            self.document = ET.parse(self.file_path)
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None and self.changes:
+            self.save()
+        self.document = None
+        return False
+    
+    def apply(self, operation: str, **kwargs) -> Any:
+        """Menerapkan satu operasi ke dokumen di memori dengan argumen yang sama seperti process_document"""
+        if self.doc_type == '.docx' and operation == "append":
+            self.document.add_paragraph(kwargs.get('content', ''))
+        
+        elif self.doc_type == '.docx' and operation == "replace":
+            self.processor._docx_replace(self.document, self.processor._replacement_map(kwargs), kwargs.get('regex', False))
+        
+        elif self.doc_type == '.xlsx' and operation == "append":
+            self.document.active.append(kwargs.get('row_data', []))
+        
+        elif self.doc_type == '.xlsx' and operation == "update_cell":
+            self.document.active.cell(row=kwargs.get('row', 1), column=kwargs.get('col', 1), value=kwargs.get('value', ''))
+        
+        elif self.doc_type == '.json' and operation == "update":
+            updates = kwargs.get('updates') or {kwargs.get('key', ''): kwargs.get('value', '')}
+            for key, value in updates.items():
+                self.processor._json_set_key(self.document, key, value)
+        
+        elif self.doc_type == '.xml' and operation == "add_element":
+            added = self.processor._xml_add_element(self.document.getroot(), kwargs.get('parent_xpath', '.'),
+                                                    kwargs.get('element_name', 'new_element'),
+                                                    kwargs.get('element_text', ''))
+            if not added:
+                return False
+        
+        else:
+            raise ValueError(f"Operasi {operation} tidak didukung untuk format {self.doc_type} dalam sesi edit")
+        
+        self.changes += 1
+        return True
+    
+    def save(self):
+        """Menyimpan dokumen secara atomik melalui file sementara lalu rename"""
+        directory = os.path.dirname(os.path.abspath(self.file_path))
+        fd, temp_file = tempfile.mkstemp(dir=directory, suffix=self.doc_type + '.tmp')
+        os.close(fd)
+        try:
+            if self.doc_type in ('.docx', '.xlsx'):
+                self.document.save(temp_file)
+            elif self.doc_type == '.json':
+                with open(temp_file, 'w', encoding='utf-8') as file:
+                    json.dump(self.document, file, indent=2, ensure_ascii=False)
+            elif self.doc_type == '.xml':
+                self.document.write(temp_file, encoding='utf-8', xml_declaration=True)
+            # mkstemp membuat file dengan mode 0600, samakan dengan file asli
+            shutil.copymode(self.file_path, temp_file)
+            os.replace(temp_file, self.file_path)
+        except BaseException:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            raise
+        
+        if self.processor.cache is not None:
+            self.processor.cache.invalidate(self.file_path)
+        self.changes = 0
+
+
+class BufferedAppender:
+    """Menampung baris lalu menambahkannya ke file sekaligus setiap batch_size baris
+    
+    Setiap flush memanggil operasi append dengan rows=batch, sehingga workbook
+    XLSX hanya di-load dan disimpan sekali per batch, bukan sekali per baris.
+    Sisa baris di-flush saat keluar dari blok with tanpa exception.
+    """
+    
+    APPENDABLE_FORMATS = ('.xlsx', '.csv', '.jsonl')
+    
+    def __init__(self, processor: DocumentProcessor, file_path: str, batch_size: int = 1000):
+        self.processor = processor
+        self.file_path = file_path
+        self.batch_size = batch_size
+        self.buffer = []
+        self.flushed_rows = 0
+    
+    def __enter__(self) -> 'BufferedAppender':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
+        return False
+    
+    def append(self, row: Any):
+        """Menambahkan satu baris ke buffer, flush otomatis jika batch sudah penuh"""
+        self.buffer.append(row)
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+    
+    def extend(self, rows: Iterable):
+        for row in rows:
+            self.append(row)
+    
+    def flush(self):
+        """Menulis isi buffer ke file"""
+        if not self.buffer:
+            return
+        self.processor.process_document(self.file_path, "append", rows=self.buffer)
+        self.flushed_rows += len(self.buffer)
+        self.buffer = []
+
+
+_worker_processor = None
+
+
+def _process_in_worker(file_path: str, operation: str, kwargs: Dict[str, Any], verbose: bool = True) -> Any:
+    """Menjalankan process_document di worker process, processor dibuat sekali per worker
+
+    Hasil lazy (generator) dibaca habis di worker karena tidak bisa di-pickle
+    untuk dikirim kembali ke process utama.
+    """
+    global _worker_processor
+    if _worker_processor is None:
+        _worker_processor = DocumentProcessor(verbose=verbose)
+    result = _worker_processor.process_document(file_path, operation, **kwargs)
+    if isinstance(result, Iterator):
+        result = list(result)
+    return result
+
+
+def _extract_pdf_pages(file_path: str, page_indices: List[int]) -> List[str]:
+    """Mengekstrak teks sekumpulan halaman PDF di dalam worker process"""
+    reader = PdfReader(file_path)
+    return [reader.pages[i].extract_text() for i in page_indices]
 
 
 # Contoh penggunaan aplikasi
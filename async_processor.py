@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Front end asyncio untuk DocumentProcessor
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+
+from app import CPU_BOUND_FORMATS, LAZY_OPERATIONS, DocumentProcessor, _process_in_worker
+
+# Penanda akhir iterator saat next() dijalankan di executor
+_EXHAUSTED = object()
+
+
+class AsyncDocumentProcessor:
+    """Membungkus DocumentProcessor agar tidak memblokir event loop
+
+    Parsing dijalankan di thread pool berukuran max_workers. Jika processes > 0,
+    format berat CPU (CPU_BOUND_FORMATS) dikirim ke process pool. Jumlah job
+    yang berjalan bersamaan dibatasi per format lewat format_limits (default
+    per_format_limit). Slot format baru dilepas setelah pekerjaan di executor
+    benar-benar selesai, termasuk saat pemanggil dibatalkan atau timeout.
+    """
+
+    def __init__(self, processor: Optional[DocumentProcessor] = None, max_workers: int = 8,
+                 processes: int = 0, per_format_limit: Optional[int] = None,
+                 format_limits: Optional[Dict[str, int]] = None):
+        self.processor = processor or DocumentProcessor(verbose=False)
+        self.per_format_limit = per_format_limit or max_workers
+        self.format_limits = format_limits or {}
+        self._thread_pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='docproc')
+        self._process_pool = ProcessPoolExecutor(max_workers=processes) if processes > 0 else None
+        self._semaphores = {}
+
+    async def __aenter__(self) -> 'AsyncDocumentProcessor':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def aclose(self):
+        """Menutup executor tanpa memblokir event loop"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.close)
+
+    def close(self):
+        self._thread_pool.shutdown(wait=True, cancel_futures=True)
+        if self._process_pool:
+            self._process_pool.shutdown(wait=True, cancel_futures=True)
+
+    async def process_document(self, file_path: str, operation: str, timeout: Optional[float] = None,
+                               **kwargs) -> Any:
+        """Versi async process_document; timeout dalam detik menghasilkan asyncio.TimeoutError
+
+        Operasi lazy (iter_rows, iter, iter_pages) sebaiknya memakai iter_rows()
+        agar setiap batch dibaca di executor, bukan di event loop.
+        """
+        doc_type = Path(file_path).suffix.lower()
+        if doc_type in CPU_BOUND_FORMATS and self._process_pool is not None:
+            call = functools.partial(_process_in_worker, file_path, operation, kwargs, self.processor.verbose)
+            executor = self._process_pool
+        else:
+            call = functools.partial(self.processor.process_document, file_path, operation, **kwargs)
+            executor = self._thread_pool
+
+        return await asyncio.wait_for(self._run(doc_type, executor, call), timeout)
+
+    async def iter_rows(self, file_path: str, operation: str = "iter_rows", chunk_size: int = 1000,
+                        **kwargs) -> AsyncIterator[list]:
+        """Membaca hasil operasi lazy secara bertahap, setiap batch chunk_size diambil di thread pool"""
+        if operation not in LAZY_OPERATIONS:
+            raise ValueError(f"Operasi {operation} tidak menghasilkan iterator; gunakan process_document(). "
+                             f"Operasi lazy: {sorted(LAZY_OPERATIONS)}")
+        doc_type = Path(file_path).suffix.lower()
+        kwargs['chunk_size'] = chunk_size
+        if doc_type == '.pdf':
+            kwargs.pop('chunk_size')
+
+        rows = await self._run(doc_type, self._thread_pool,
+                               functools.partial(self.processor.process_document, file_path, operation, **kwargs))
+        if not isinstance(rows, Iterator):
+            raise ValueError(f"Operasi {operation} untuk format {doc_type} tidak menghasilkan iterator")
+        try:
+            while True:
+                batch = await self._run(doc_type, self._thread_pool, functools.partial(next, rows, _EXHAUSTED))
+                if batch is _EXHAUSTED:
+                    break
+                yield batch
+        finally:
+            # Generator sinkron ditutup di thread pool agar file yang dipegangnya ikut tertutup
+            close = getattr(rows, 'close', None)
+            if close is not None:
+                await asyncio.get_running_loop().run_in_executor(self._thread_pool, close)
+
+    async def _run(self, doc_type: str, executor, call) -> Any:
+        """Menjalankan call di executor dengan slot semaphore per format"""
+        semaphore = self._semaphore(doc_type)
+        await semaphore.acquire()
+        loop = asyncio.get_running_loop()
+        try:
+            future = executor.submit(call)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        # Slot dilepas saat pekerjaan selesai di executor, bukan saat pemanggil dibatalkan
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(semaphore.release))
+        return await asyncio.wrap_future(future)
+
+    def _semaphore(self, doc_type: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(doc_type)
+        if semaphore is None:
+            limit = self.format_limits.get(doc_type, self.per_format_limit)
+            semaphore = self._semaphores[doc_type] = asyncio.Semaphore(limit)
+        return semaphore
+
+
+async def main():
+    """Contoh penggunaan: membaca beberapa dokumen secara bersamaan"""
+    async with AsyncDocumentProcessor(max_workers=4) as processor:
+        tasks = [processor.process_document(path, "read", timeout=30)
+                 for path in ("testing.docx", "testing.docx")]
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(result, Exception):
+                print(f"❌ Error: {result}")
+            else:
+                print(f"✅ {len(result):,} karakter dibaca")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Benchmark DocumentProcessor untuk setiap format dan operasi
+
+Contoh:
+    python benchmark.py --rows 5000 --repeat 5 --output hasil.json
+    python benchmark.py --baseline baseline.json --threshold 0.2
+    python benchmark.py --startup
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from app import DocumentProcessor
+
+
+def _make_pdf(file_path: str, pages: int):
+    """Membuat file PDF sederhana berisi satu baris teks per halaman"""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>"]
+    kids = ' '.join(f'{3 + 2 * i} 0 R' for i in range(pages))
+    objects.append(f"<< /Type /Pages /Kids [{kids}] /Count {pages} >>")
+    font_id = 3 + 2 * pages
+    for i in range(pages):
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {4 + 2 * i} 0 R >>")
+        stream = f"BT /F1 12 Tf 72 700 Td (Halaman {i + 1} dokumen benchmark) Tj ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+    objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    output = b"%PDF-1.4\n"
+    offsets = []
+    for i, body in enumerate(objects):
+        offsets.append(len(output))
+        output += f"{i + 1} 0 obj\n{body}\nendobj\n".encode('latin-1')
+    xref = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode('latin-1')
+    for offset in offsets:
+        output += f"{offset:010d} 00000 n \n".encode('latin-1')
+    output += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode('latin-1')
+    with open(file_path, 'wb') as file:
+        file.write(output)
+
+
+def _rows(rows: int) -> List[List[Any]]:
+    return [["Nama", "Umur", "Kota"]] + [[f"Orang {i}", 20 + i % 50, f"Kota {i % 100}"] for i in range(rows)]
+
+
+def _text(rows: int) -> str:
+    return '\n'.join(f"Baris {i}: watermark {{{{nama}}}} pada bahan ajar digital" for i in range(rows))
+
+
+def _records(rows: int) -> List[Dict[str, Any]]:
+    return [{"id": i, "nama": f"Orang {i}", "kota": f"Kota {i % 100}"} for i in range(rows)]
+
+
+def _nested(rows: int) -> Dict[str, Any]:
+    return {"aplikasi": "Document Processor", "versi": "1.0",
+            "data": {f"item{i}": {"nama": f"Item {i}", "stok": i} for i in range(rows)}}
+
+
+# Argumen setiap operasi per format. Fungsi menerima jumlah baris korpus.
+BENCHMARKS: Dict[str, Dict[str, Callable[[int], Dict[str, Any]]]] = {
+    '.txt': {
+        'read': lambda n: {},
+        'iter_rows': lambda n: {},
+        'tail': lambda n: {'n': 100},
+        'write': lambda n: {'content': _text(n)},
+        'append': lambda n: {'content': "Baris tambahan."},
+        'replace': lambda n: {'replacements': {'{{nama}}': 'Budi', 'watermark': 'tanda air'}},
+    },
+    '.docx': {
+        'read': lambda n: {},
+        'write': lambda n: {'content': _text(n)},
+        'append': lambda n: {'content': "Paragraf tambahan."},
+        'replace': lambda n: {'old_text': 'watermark', 'new_text': 'tanda air'},
+    },
+    '.xlsx': {
+        'read': lambda n: {},
+        'iter_rows': lambda n: {},
+        'write': lambda n: {'data': _rows(n)},
+        'append': lambda n: {'row_data': ["Baru", 1, "Kota"]},
+        'update_cell': lambda n: {'row': 2, 'col': 3, 'value': 8},
+    },
+    '.csv': {
+        'read': lambda n: {},
+        'iter_rows': lambda n: {},
+        'write': lambda n: {'data': _rows(n)},
+        'append': lambda n: {'row_data': ["Baru", 1, "Kota"]},
+    },
+    '.json': {
+        'read': lambda n: {},
+        'query': lambda n: {'key': f'data.item{n - 1}.nama'},
+        'write': lambda n: {'data': _nested(n)},
+        'update': lambda n: {'key': 'versi', 'value': '1.1'},
+    },
+    '.jsonl': {
+        'read': lambda n: {},
+        'iter_rows': lambda n: {},
+        'write': lambda n: {'data': _records(n)},
+        'append': lambda n: {'row_data': {"id": -1}},
+    },
+    '.xml': {
+        'read': lambda n: {},
+        'iter': lambda n: {'tag': 'nama'},
+        'query': lambda n: {'xpath': 'data/item0'},
+        'write': lambda n: {'data': _nested(n)['data'], 'root_name': 'data'},
+        'add_element': lambda n: {'parent_xpath': '.', 'element_name': 'baru', 'element_text': 'isi'},
+    },
+    '.pdf': {
+        'read': lambda n: {},
+        'iter_pages': lambda n: {},
+    },
+}
+
+
+def generate_corpus(directory: str, rows: int, formats: Optional[List[str]] = None) -> Dict[str, str]:
+    """Membuat satu file template per format, mengembalikan {ekstensi: path}"""
+    processor = DocumentProcessor(verbose=False)
+    formats = formats or list(BENCHMARKS)
+    templates = {}
+
+    for ext in formats:
+        file_path = os.path.join(directory, f"korpus{ext}")
+        if ext == '.pdf':
+            _make_pdf(file_path, max(1, rows // 50))
+            templates[ext] = file_path
+            continue
+
+        if ext in ('.txt', '.docx'):
+            processor.process_document(file_path, "write", content=_text(rows))
+        elif ext in ('.xlsx', '.csv'):
+            processor.process_document(file_path, "write", data=_rows(rows))
+        elif ext == '.json':
+            processor.process_document(file_path, "write", data=_nested(rows))
+        elif ext == '.jsonl':
+            processor.process_document(file_path, "write", data=_records(rows))
+        elif ext == '.xml':
+            processor.process_document(file_path, "write", data=_nested(rows)['data'], root_name='data')
+        templates[ext] = file_path
+
+    return templates
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    """Persentil metode nearest-rank"""
+    index = max(0, min(len(sorted_values) - 1, int(round(percent / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def _consume(result: Any):
+    """Menghabiskan hasil berupa generator supaya waktu baca lazy ikut terukur"""
+    if hasattr(result, '__next__'):
+        for _ in result:
+            pass
+
+
+def run_case(template: str, ext: str, operation: str, rows: int, repeat: int) -> Dict[str, Any]:
+    """Menjalankan satu kombinasi format/operasi, dipanggil di process terpisah"""
+    processor = DocumentProcessor(verbose=False)
+    kwargs = BENCHMARKS[ext][operation](rows)
+    work_file = os.path.join(os.path.dirname(template), f"kerja_{operation}{ext}")
+    input_bytes = os.path.getsize(template)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    timings = []
+
+    for _ in range(repeat):
+        # File kerja dipulihkan dari template sebelum setiap iterasi (tidak ikut diukur)
+        shutil.copyfile(template, work_file)
+        start = time.perf_counter()
+        _consume(processor.process_document(work_file, operation, **kwargs))
+        timings.append(time.perf_counter() - start)
+
+    os.remove(work_file)
+    timings.sort()
+    mean = sum(timings) / len(timings)
+    return {
+        'format': ext,
+        'operation': operation,
+        'repeat': repeat,
+        'input_bytes': input_bytes,
+        'mean_s': mean,
+        'p50_s': _percentile(timings, 50),
+        'p99_s': _percentile(timings, 99),
+        'ops_per_s': 1 / mean if mean else 0.0,
+        'mb_per_s': input_bytes / mean / 1024 / 1024 if mean else 0.0,
+        'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        'rss_growth_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before,
+    }
+
+
+def run_suite(rows: int = 2000, repeat: int = 5, formats: Optional[List[str]] = None,
+              operations: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Menjalankan seluruh benchmark; setiap kasus di process baru agar peak RSS terpisah"""
+    formats = formats or list(BENCHMARKS)
+    results = {}
+    work_dir = tempfile.mkdtemp(prefix='docbench_')
+    context = multiprocessing.get_context('spawn')
+
+    try:
+        templates = generate_corpus(work_dir, rows, formats)
+        with context.Pool(processes=1, maxtasksperchild=1) as pool:
+            for ext in formats:
+                for operation in BENCHMARKS[ext]:
+                    if operations and operation not in operations:
+                        continue
+                    name = f"{ext.lstrip('.')}.{operation}"
+                    try:
+                        results[name] = pool.apply(run_case, (templates[ext], ext, operation, rows, repeat))
+                    except Exception as e:
+                        results[name] = {'format': ext, 'operation': operation, 'error': f"{type(e).__name__}: {e}"}
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'rows': rows,
+            'repeat': repeat,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+
+
+# Kode yang diukur di interpreter baru: import app saja (lazy) dibanding import app
+# bersama semua library format seperti sebelum registry lazy (eager)
+STARTUP_CASES = {
+    'lazy': "import app; app.DocumentProcessor(verbose=False)",
+    'eager': ("import app; app.DocumentProcessor(verbose=False)\n"
+              "for name in ('docx', 'openpyxl', 'PyPDF2'):\n"
+              "    try:\n"
+              "        __import__(name)\n"
+              "    except ImportError:\n"
+              "        pass"),
+}
+
+_STARTUP_TEMPLATE = """import time
+start = time.perf_counter()
+{code}
+print(time.perf_counter() - start)
+"""
+
+
+def measure_startup(repeat: int = 5) -> Dict[str, Any]:
+    """Mengukur waktu cold import app di process Python baru untuk setiap kasus STARTUP_CASES"""
+    root = os.path.dirname(os.path.abspath(__file__))
+    results = {}
+    for name, code in STARTUP_CASES.items():
+        timings = []
+        for _ in range(repeat):
+            output = subprocess.run([sys.executable, '-c', _STARTUP_TEMPLATE.format(code=code)], cwd=root,
+                                    capture_output=True, text=True, check=True).stdout
+            timings.append(float(output.strip().splitlines()[-1]))
+        timings.sort()
+        results[name] = {'repeat': repeat, 'p50_s': _percentile(timings, 50), 'min_s': timings[0]}
+    return results
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.2) -> List[str]:
+    """Membandingkan hasil dengan baseline, mengembalikan daftar regresi p50/p99/RSS"""
+    regressions = []
+    for name, current in results['results'].items():
+        previous = baseline.get('results', {}).get(name)
+        if not previous or 'error' in previous:
+            continue
+        if 'error' in current:
+            regressions.append(f"{name}: gagal ({current['error']})")
+            continue
+        for metric in ('p50_s', 'p99_s', 'peak_rss_kb'):
+            if previous[metric] and current[metric] > previous[metric] * (1 + threshold):
+                change = (current[metric] / previous[metric] - 1) * 100
+                regressions.append(f"{name}: {metric} naik {change:.0f}% "
+                                   f"({previous[metric]:.4g} -> {current[metric]:.4g})")
+    return regressions
+
+
+def print_table(results: Dict[str, Any]):
+    print(f"{'kasus':<22}{'p50 (ms)':>12}{'p99 (ms)':>12}{'MB/s':>10}{'peak RSS (KB)':>16}")
+    for name, result in results['results'].items():
+        if 'error' in result:
+            print(f"{name:<22}  ERROR {result['error']}")
+            continue
+        print(f"{name:<22}{result['p50_s'] * 1000:>12.2f}{result['p99_s'] * 1000:>12.2f}"
+              f"{result['mb_per_s']:>10.2f}{result['peak_rss_kb']:>16,}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DocumentProcessor")
+    parser.add_argument('--rows', type=int, default=2000, help="jumlah baris/paragraf/record korpus sintetis")
+    parser.add_argument('--repeat', type=int, default=5, help="jumlah pengulangan per operasi")
+    parser.add_argument('--formats', nargs='*', help="format yang diuji, misalnya .csv .xlsx")
+    parser.add_argument('--operations', nargs='*', help="operasi yang diuji, misalnya read write")
+    parser.add_argument('--output', default='benchmark_results.json', help="file hasil JSON")
+    parser.add_argument('--baseline', help="file hasil sebelumnya untuk dibandingkan")
+    parser.add_argument('--threshold', type=float, default=0.2, help="batas kenaikan relatif yang dianggap regresi")
+    parser.add_argument('--startup', action='store_true', help="hanya mengukur waktu cold import (lazy vs eager)")
+    args = parser.parse_args()
+
+    if args.startup:
+        startup = measure_startup(args.repeat)
+        print(f"{'kasus':<22}{'p50 (ms)':>12}{'min (ms)':>12}")
+        for name, result in startup.items():
+            print(f"{name:<22}{result['p50_s'] * 1000:>12.2f}{result['min_s'] * 1000:>12.2f}")
+        return
+
+    results = run_suite(args.rows, args.repeat, args.formats, args.operations)
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2)
+    print_table(results)
+    print(f"\nHasil disimpan ke {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("\n❌ REGRESI TERDETEKSI:")
+            for line in regressions:
+                print(f"   • {line}")
+            sys.exit(1)
+        print("\n✅ Tidak ada regresi dibanding baseline")
+
+
+if __name__ == "__main__":
+    main()
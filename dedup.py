@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Deteksi dokumen hampir sama (near-duplicate) dengan MinHash dan LSH
+
+Contoh:
+    python dedup.py /data/dokumen --threshold 0.8
+"""
+
+import argparse
+import hashlib
+import os
+import sqlite3
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app import DocumentProcessor
+from search_index import tokenize
+
+_HASH_MAX = (1 << 64) - 1
+
+
+def shingles(text: str, size: int = 5) -> set:
+    """Membentuk himpunan shingle berupa size kata berurutan"""
+    tokens = tokenize(text)
+    if len(tokens) < size:
+        return {' '.join(tokens)} if tokens else set()
+    return {' '.join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+
+def minhash_signature(items: Iterable[str], num_perm: int = 128) -> array:
+    """Signature MinHash satu permutasi (one-permutation hashing) dengan densifikasi
+
+    Setiap shingle cukup di-hash sekali: hash menentukan bin dan nilainya,
+    dan signature menyimpan nilai minimum per bin. Bin kosong (dokumen
+    pendek) diisi dari bin terisi berikutnya, sehingga dua dokumen tetap dapat
+    dibandingkan per posisi dan fraksi posisi yang sama memperkirakan Jaccard.
+    """
+    signature = array('Q', [_HASH_MAX]) * num_perm
+    for item in items:
+        value = int.from_bytes(hashlib.blake2b(item.encode('utf-8'), digest_size=8).digest(), 'little')
+        slot, rest = value % num_perm, value // num_perm
+        if rest < signature[slot]:
+            signature[slot] = rest
+
+    filled = {i for i, value in enumerate(signature) if value != _HASH_MAX}
+    if filled and len(filled) < num_perm:
+        step = _HASH_MAX // num_perm // (num_perm + 1)
+        for i in range(num_perm):
+            if i in filled:
+                continue
+            # Bin terisi terdekat di sebelah kanan (melingkar); jaraknya ikut dikodekan
+            offset = 1
+            while (i + offset) % num_perm not in filled:
+                offset += 1
+            signature[i] = signature[(i + offset) % num_perm] % step + offset * step
+    return signature
+
+
+def estimate_similarity(first: array, second: array) -> float:
+    """Perkiraan kemiripan Jaccard dari dua signature MinHash"""
+    if not first:
+        return 0.0
+    return sum(1 for a, b in zip(first, second) if a == b) / len(first)
+
+
+class DuplicateIndex:
+    """Index LSH untuk mencari dokumen hampir sama tanpa membandingkan semua pasangan
+
+    Signature semua dokumen disimpan berurutan dalam satu array('Q'). Setiap
+    signature dibagi menjadi bands; dokumen yang sama persis pada salah satu
+    band menjadi kandidat, lalu kandidat diverifikasi dengan perkiraan
+    Jaccard. Jika index_path diberikan, signature disimpan di SQLite dan hanya
+    dihitung ulang saat ukuran/mtime file berubah.
+    """
+
+    def __init__(self, index_path: Optional[str] = None, processor: Optional[DocumentProcessor] = None,
+                 num_perm: int = 128, bands: int = 32, shingle_size: int = 5, threshold: float = 0.8):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) harus habis dibagi bands ({bands})")
+        self.processor = processor or DocumentProcessor(verbose=False)
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+        self.keys = []
+        self.signatures = array('Q')
+        self._ids = {}
+        self._buckets = [{} for _ in range(bands)]
+        self.conn = None
+
+        if index_path:
+            self.conn = sqlite3.connect(index_path)
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS signatures (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    num_perm INTEGER NOT NULL,
+                    shingle_size INTEGER NOT NULL,
+                    signature BLOB NOT NULL
+                );
+            """)
+            for path, blob in self.conn.execute(
+                    "SELECT path, signature FROM signatures WHERE num_perm = ? AND shingle_size = ?",
+                    (num_perm, shingle_size)):
+                signature = array('Q')
+                signature.frombytes(blob)
+                self._insert(path, signature)
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+
+    def signature_for_text(self, text: str) -> array:
+        return minhash_signature(shingles(text, self.shingle_size), self.num_perm)
+
+    def add_text(self, key: str, text: str) -> int:
+        """Menambahkan teks dengan kunci bebas, mengembalikan id dokumen"""
+        return self._insert(key, self.signature_for_text(text))
+
+    def add_file(self, file_path: str) -> int:
+        """Menambahkan file format apa pun yang didukung; signature tersimpan dipakai ulang jika file tidak berubah"""
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        if self.conn is not None:
+            row = self.conn.execute(
+                "SELECT size, mtime_ns FROM signatures WHERE path = ? AND num_perm = ? AND shingle_size = ?",
+                (path, self.num_perm, self.shingle_size)).fetchone()
+            if row == (stat.st_size, stat.st_mtime_ns) and path in self._ids:
+                return self._ids[path]
+
+        signature = self.signature_for_text(self.processor.extract_text(path))
+        if self.conn is not None:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO signatures (path, size, mtime_ns, num_perm, shingle_size, signature) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (path, stat.st_size, stat.st_mtime_ns, self.num_perm, self.shingle_size, signature.tobytes()))
+        return self._insert(path, signature)
+
+    def add_directory(self, directory: str) -> Dict[str, int]:
+        """Menambahkan semua file berformat didukung di dalam folder (rekursif)"""
+        formats = set(self.processor.supported_formats)
+        summary = {'added': 0, 'failed': 0}
+        for root, _, files in os.walk(directory):
+            for name in sorted(files):
+                if os.path.splitext(name)[1].lower() not in formats:
+                    continue
+                try:
+                    self.add_file(os.path.join(root, name))
+                    summary['added'] += 1
+                except Exception:
+                    summary['failed'] += 1
+        return summary
+
+    def query(self, file_path: Optional[str] = None, text: Optional[str] = None,
+              threshold: Optional[float] = None) -> List[Tuple[str, float]]:
+        """Mencari dokumen yang mirip dengan sebuah file atau teks, urut dari yang paling mirip"""
+        if text is not None:
+            signature, own = self.signature_for_text(text), None
+        else:
+            path = os.path.abspath(file_path)
+            own = self._ids.get(path)
+            if own is None:
+                signature = self.signature_for_text(self.processor.extract_text(path))
+            else:
+                signature = self._signature(own)
+
+        threshold = self.threshold if threshold is None else threshold
+        matches = []
+        for doc_id in self._candidates(signature):
+            if doc_id == own:
+                continue
+            similarity = estimate_similarity(signature, self._signature(doc_id))
+            if similarity >= threshold:
+                matches.append((self.keys[doc_id], similarity))
+        return sorted(matches, key=lambda match: (-match[1], match[0]))
+
+    def clusters(self, threshold: Optional[float] = None) -> List[List[str]]:
+        """Mengelompokkan dokumen hampir sama (union-find atas pasangan kandidat LSH)"""
+        threshold = self.threshold if threshold is None else threshold
+        parent = list(range(len(self.keys)))
+
+        def find(doc_id: int) -> int:
+            while parent[doc_id] != doc_id:
+                parent[doc_id] = parent[parent[doc_id]]
+                doc_id = parent[doc_id]
+            return doc_id
+
+        checked = set()
+        for buckets in self._buckets:
+            for members in buckets.values():
+                for i, first in enumerate(members):
+                    for second in members[i + 1:]:
+                        pair = (first, second)
+                        if pair in checked:
+                            continue
+                        checked.add(pair)
+                        if estimate_similarity(self._signature(first), self._signature(second)) >= threshold:
+                            parent[find(second)] = find(first)
+
+        groups = {}
+        for doc_id in range(len(self.keys)):
+            groups.setdefault(find(doc_id), []).append(self.keys[doc_id])
+        return sorted((sorted(group) for group in groups.values() if len(group) > 1), key=lambda group: group[0])
+
+    def _insert(self, key: str, signature: array) -> int:
+        doc_id = self._ids.get(key)
+        if doc_id is not None:
+            # Dokumen berubah: signature lama diganti dan band lama dilepas dari bucket
+            self._unbucket(doc_id)
+            start = doc_id * self.num_perm
+            self.signatures[start:start + self.num_perm] = signature
+        else:
+            doc_id = len(self.keys)
+            self.keys.append(key)
+            self._ids[key] = doc_id
+            self.signatures.extend(signature)
+
+        # Dokumen tanpa teks tidak dimasukkan ke bucket agar tidak dianggap sama satu sama lain
+        if any(value != _HASH_MAX for value in signature):
+            for band, key_bytes in enumerate(self._band_keys(signature)):
+                self._buckets[band].setdefault(key_bytes, []).append(doc_id)
+        return doc_id
+
+    def _unbucket(self, doc_id: int):
+        for band, key_bytes in enumerate(self._band_keys(self._signature(doc_id))):
+            members = self._buckets[band].get(key_bytes)
+            if members and doc_id in members:
+                members.remove(doc_id)
+                if not members:
+                    del self._buckets[band][key_bytes]
+
+    def _candidates(self, signature: array) -> set:
+        candidates = set()
+        for band, key_bytes in enumerate(self._band_keys(signature)):
+            candidates.update(self._buckets[band].get(key_bytes, ()))
+        return candidates
+
+    def _band_keys(self, signature: array) -> List[bytes]:
+        return [signature[i:i + self.rows].tobytes() for i in range(0, self.num_perm, self.rows)]
+
+    def _signature(self, doc_id: int) -> array:
+        start = doc_id * self.num_perm
+        return self.signatures[start:start + self.num_perm]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mencari kelompok dokumen hampir sama di sebuah folder")
+    parser.add_argument('directory', help="folder dokumen")
+    parser.add_argument('--threshold', type=float, default=0.8, help="batas kemiripan Jaccard (0-1)")
+    parser.add_argument('--index', help="file SQLite untuk menyimpan signature (default <folder>/.dedup_index.db)")
+    args = parser.parse_args()
+
+    index = DuplicateIndex(args.index or os.path.join(args.directory, '.dedup_index.db'), threshold=args.threshold)
+    print(f"Index: {index.add_directory(args.directory)}")
+    clusters = index.clusters()
+    if not clusters:
+        print("✅ Tidak ada dokumen yang hampir sama")
+    for number, cluster in enumerate(clusters, 1):
+        print(f"Kelompok {number}:")
+        for path in cluster:
+            print(f"   • {path}")
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
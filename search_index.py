@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Indeks kata (inverted index) untuk pencarian cepat di banyak dokumen
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import sys
+from array import array
+from typing import Dict, Iterable, List, Optional
+
+from app import DocumentProcessor
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+
+def tokenize(text: str) -> List[str]:
+    """Memecah teks menjadi token huruf kecil"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class SearchIndex:
+    """Inverted index dengan posisi kata, disimpan di SQLite
+    
+    Setiap dokumen hanya di-index ulang jika ukuran/mtime berubah dan hash
+    isinya juga berbeda. Posisi kata disimpan sebagai array integer sehingga
+    query phrase dapat dijawab tanpa membaca ulang dokumen.
+    """
+    
+    def __init__(self, index_path: str, processor: Optional[DocumentProcessor] = None):
+        self.index_path = index_path
+        self.processor = processor or DocumentProcessor(verbose=False)
+        self.conn = sqlite3.connect(index_path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS documents (
+                id INTEGER PRIMARY KEY,
+                path TEXT UNIQUE NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                content_hash TEXT NOT NULL,
+                token_count INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS postings (
+                term TEXT NOT NULL,
+                doc_id INTEGER NOT NULL,
+                positions BLOB NOT NULL,
+                PRIMARY KEY (term, doc_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS postings_doc ON postings (doc_id);
+        """)
+    
+    def close(self):
+        self.conn.close()
+    
+    def index_paths(self, paths: Iterable[str]) -> Dict[str, int]:
+        """Meng-index daftar file, mengembalikan jumlah file yang di-index, dilewati dan gagal"""
+        summary = {'indexed': 0, 'skipped': 0, 'failed': 0}
+        for path in paths:
+            try:
+                status = self.index_file(path)
+            except Exception:
+                status = 'failed'
+            summary[status] += 1
+        return summary
+    
+    def index_directory(self, directory: str) -> Dict[str, int]:
+        """Meng-index semua file berformat didukung di dalam folder (rekursif)"""
+        formats = set(self.processor.supported_formats)
+        paths = []
+        for root, _, files in os.walk(directory):
+            for name in files:
+                if os.path.splitext(name)[1].lower() in formats:
+                    paths.append(os.path.join(root, name))
+        summary = self.index_paths(sorted(paths))
+        summary['removed'] = self.prune()
+        return summary
+    
+    def index_file(self, file_path: str) -> str:
+        """Meng-index satu file jika berubah, mengembalikan 'indexed' atau 'skipped'"""
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        row = self.conn.execute(
+            "SELECT id, size, mtime_ns, content_hash FROM documents WHERE path = ?", (path,)
+        ).fetchone()
+        
+        if row and row[1] == stat.st_size and row[2] == stat.st_mtime_ns:
+            return 'skipped'
+        
+        content_hash = self._file_hash(path)
+        if row and row[3] == content_hash:
+            # Hanya metadata yang berubah (misalnya di-touch), isi tetap sama
+            with self.conn:
+                self.conn.execute("UPDATE documents SET size = ?, mtime_ns = ? WHERE id = ?",
+                                  (stat.st_size, stat.st_mtime_ns, row[0]))
+            return 'skipped'
+        
+        tokens = tokenize(self.processor.extract_text(path))
+        positions = {}
+        for position, token in enumerate(tokens):
+            positions.setdefault(token, array('I')).append(position)
+        
+        with self.conn:
+            if row:
+                self.conn.execute("DELETE FROM postings WHERE doc_id = ?", (row[0],))
+                self.conn.execute(
+                    "UPDATE documents SET size = ?, mtime_ns = ?, content_hash = ?, token_count = ? WHERE id = ?",
+                    (stat.st_size, stat.st_mtime_ns, content_hash, len(tokens), row[0]))
+                doc_id = row[0]
+            else:
+                cursor = self.conn.execute(
+                    "INSERT INTO documents (path, size, mtime_ns, content_hash, token_count) VALUES (?, ?, ?, ?, ?)",
+                    (path, stat.st_size, stat.st_mtime_ns, content_hash, len(tokens)))
+                doc_id = cursor.lastrowid
+            self.conn.executemany(
+                "INSERT INTO postings (term, doc_id, positions) VALUES (?, ?, ?)",
+                ((term, doc_id, term_positions.tobytes()) for term, term_positions in positions.items()))
+        return 'indexed'
+    
+    def prune(self) -> int:
+        """Menghapus dokumen yang filenya sudah tidak ada dari index"""
+        missing = [(doc_id,) for doc_id, path in self.conn.execute("SELECT id, path FROM documents")
+                   if not os.path.exists(path)]
+        with self.conn:
+            self.conn.executemany("DELETE FROM postings WHERE doc_id = ?", missing)
+            self.conn.executemany("DELETE FROM documents WHERE id = ?", missing)
+        return len(missing)
+    
+    def search(self, term: str) -> Dict[str, int]:
+        """Mencari satu kata, mengembalikan {path: jumlah kemunculan}"""
+        return {path: len(positions) for path, positions in self._postings(term.lower()).items()}
+    
+    def search_phrase(self, phrase: str) -> Dict[str, int]:
+        """Mencari frasa (kata berurutan), mengembalikan {path: jumlah kemunculan}"""
+        terms = tokenize(phrase)
+        if not terms:
+            return {}
+        if len(terms) == 1:
+            return self.search(terms[0])
+        
+        postings = [self._postings(term) for term in terms]
+        common = set(postings[0]).intersection(*postings[1:])
+        
+        results = {}
+        for path in common:
+            following = [set(p[path]) for p in postings[1:]]
+            count = sum(1 for start in postings[0][path]
+                        if all(start + offset in positions for offset, positions in enumerate(following, 1)))
+            if count:
+                results[path] = count
+        return results
+    
+    def count_keywords(self, keywords: Iterable[str], file_path: Optional[str] = None) -> Dict[str, int]:
+        """Menghitung kemunculan beberapa kata/frasa, di satu file atau seluruh korpus"""
+        target = os.path.abspath(file_path) if file_path else None
+        counts = {}
+        for keyword in keywords:
+            results = self.search_phrase(keyword)
+            if target:
+                counts[keyword] = results.get(target, 0)
+            else:
+                counts[keyword] = sum(results.values())
+        return counts
+    
+    def _postings(self, term: str) -> Dict[str, array]:
+        """Mengambil daftar posisi kata per dokumen"""
+        postings = {}
+        for path, blob in self.conn.execute(
+                "SELECT d.path, p.positions FROM postings p JOIN documents d ON d.id = p.doc_id WHERE p.term = ?",
+                (term,)):
+            positions = array('I')
+            positions.frombytes(blob)
+            postings[path] = positions
+        return postings
+    
+    def _file_hash(self, path: str) -> str:
+        digest = hashlib.sha1()
+        with open(path, 'rb') as file:
+            for block in iter(lambda: file.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+
+def main():
+    """Contoh penggunaan: python search_index.py <folder> <kata kunci>..."""
+    if len(sys.argv) < 3:
+        print("Penggunaan: python search_index.py <folder> <kata kunci>...")
+        return
+    
+    index = SearchIndex(os.path.join(sys.argv[1], '.search_index.db'))
+    summary = index.index_directory(sys.argv[1])
+    print(f"Index: {summary}")
+    
+    for keyword in sys.argv[2:]:
+        for path, count in sorted(index.search_phrase(keyword).items()):
+            print(f"'{keyword}': {count} kali di {path}")
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
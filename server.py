@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Mode server DocumentProcessor dengan pool worker process yang tetap hangat
+
+Job dikirim sebagai JSON lewat HTTP (POST /jobs) atau Unix socket (satu job
+JSON per baris):
+
+    {"id": 1, "path": "data.csv", "operation": "read", "kwargs": {}, "timeout": 30}
+
+Balasan: {"id": 1, "ok": true, "result": ..., "elapsed_s": 0.01} atau
+{"id": 1, "ok": false, "error": "..."}.
+
+Secara default hanya operasi baca (READ_OPERATIONS) yang diizinkan; operasi
+tulis harus dibuka lewat --allow, dan --root membatasi path ke satu folder.
+Request HTTP wajib ber-Content-Type application/json sehingga halaman web
+lain tidak bisa mengirim job tanpa preflight CORS.
+
+Contoh:
+    python server.py --port 8765 --workers 4
+    python server.py --unix /tmp/docproc.sock --max-jobs 200
+    python server.py --root /data --allow read,iter_rows,write
+"""
+
+import argparse
+import array
+import datetime
+import json
+import multiprocessing
+import os
+import queue
+import socket
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from app import READ_OPERATIONS, Document, DocumentProcessor, PdfReader, openpyxl
+
+
+class ServerBusyError(RuntimeError):
+    """Antrean job penuh; klien sebaiknya mencoba lagi nanti"""
+
+
+class JobForbiddenError(PermissionError):
+    """Operasi atau path job tidak diizinkan oleh konfigurasi server"""
+
+
+def _serve_worker(conn, verbose: bool, preload: bool):
+    """Loop worker: satu DocumentProcessor dipakai untuk semua job sampai diminta berhenti"""
+    if preload:
+        # Library format dimuat di awal supaya job pertama tidak menanggung biaya import
+        for library in (Document, openpyxl, PdfReader):
+            try:
+                library._load()
+            except ImportError:
+                pass
+    processor = DocumentProcessor(verbose=verbose)
+
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            break
+        if job is None:
+            break
+        try:
+            result = processor.process_document(job['path'], job['operation'], **job.get('kwargs', {}))
+            # Hasil lazy (generator) dibaca habis di worker karena tidak bisa dikirim lewat pipe
+            if isinstance(result, Iterator):
+                result = list(result)
+            conn.send({'ok': True, 'result': result})
+        except Exception as e:
+            conn.send({'ok': False, 'error': f"{type(e).__name__}: {e}"})
+    conn.close()
+
+
+class _Worker:
+    def __init__(self, context, verbose: bool, preload: bool):
+        self.conn, child = context.Pipe()
+        self.process = context.Process(target=_serve_worker, args=(child, verbose, preload), daemon=True)
+        self.process.start()
+        child.close()
+        self.jobs = 0
+
+    def stop(self, timeout: float = 5):
+        try:
+            self.conn.send(None)
+        except (OSError, BrokenPipeError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class WorkerPool:
+    """Pool worker process yang masing-masing menyimpan DocumentProcessor
+
+    Jumlah job yang diterima (sedang jalan + menunggu worker) dibatasi
+    max_pending; job di atas batas itu ditolak dengan ServerBusyError. Job
+    yang melewati timeout membuat worker-nya dihentikan dan diganti. Worker
+    juga diganti setelah max_jobs_per_worker job supaya memori tidak terus tumbuh.
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_jobs_per_worker: int = 500,
+                 max_pending: Optional[int] = None, verbose: bool = False, preload: bool = True):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.verbose = verbose
+        self.preload = preload
+        self._context = multiprocessing.get_context('spawn')
+        self._admission = threading.BoundedSemaphore(max_pending or self.workers * 4)
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self.stats = {'completed': 0, 'failed': 0, 'timeouts': 0, 'rejected': 0, 'recycled': 0}
+        for _ in range(self.workers):
+            self._idle.put(self._spawn())
+
+    def _spawn(self) -> _Worker:
+        return _Worker(self._context, self.verbose, self.preload)
+
+    def _count(self, name: str):
+        with self._lock:
+            self.stats[name] += 1
+
+    def run(self, path: str, operation: str, kwargs: Optional[Dict[str, Any]] = None,
+            timeout: Optional[float] = None) -> Any:
+        """Menjalankan satu job di worker yang sedang bebas dan mengembalikan hasilnya"""
+        if self._closed:
+            raise RuntimeError("Worker pool sudah ditutup")
+        if not self._admission.acquire(blocking=False):
+            self._count('rejected')
+            raise ServerBusyError("Server sibuk, antrean job penuh")
+
+        try:
+            worker = self._idle.get()
+            replace = None
+            try:
+                try:
+                    worker.conn.send({'path': path, 'operation': operation, 'kwargs': kwargs or {}})
+                except (OSError, BrokenPipeError):
+                    # Worker mati saat menganggur; diganti agar tidak kembali ke antrean idle
+                    replace = 'kill'
+                    raise RuntimeError("Worker berhenti secara tak terduga")
+                if not worker.conn.poll(timeout):
+                    self._count('timeouts')
+                    replace = 'kill'
+                    raise TimeoutError(f"Job melebihi batas waktu {timeout} detik")
+                try:
+                    reply = worker.conn.recv()
+                except EOFError:
+                    replace = 'kill'
+                    raise RuntimeError("Worker berhenti secara tak terduga")
+
+                worker.jobs += 1
+                if worker.jobs >= self.max_jobs_per_worker:
+                    self._count('recycled')
+                    replace = 'stop'
+            finally:
+                if replace:
+                    # Worker pengganti dibuat di background agar balasan job ini tidak ikut tertunda
+                    threading.Thread(target=self._replace, args=(worker, replace == 'kill'), daemon=True).start()
+                else:
+                    self._idle.put(worker)
+
+            if not reply['ok']:
+                self._count('failed')
+                raise RuntimeError(reply['error'])
+            self._count('completed')
+            return reply['result']
+        finally:
+            self._admission.release()
+
+    def _replace(self, worker: _Worker, kill: bool):
+        if kill:
+            worker.kill()
+        else:
+            worker.stop()
+        self._idle.put(self._spawn())
+
+    def close(self):
+        """Menghentikan semua worker; job yang sedang berjalan ditunggu selesai"""
+        self._closed = True
+        for _ in range(self.workers):
+            self._idle.get().stop()
+
+
+def _json_default(value: Any) -> Any:
+    """Mengubah tipe hasil yang tidak dikenal json (array, tanggal, set, bytes) menjadi bentuk JSON"""
+    if isinstance(value, array.array):
+        return value.tolist()
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, bytes):
+        return value.decode('utf-8', errors='replace')
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    return str(value)
+
+
+def check_job(path: str, operation: str, allowed_operations: Iterable[str] = READ_OPERATIONS,
+              root: Optional[str] = None) -> str:
+    """Memastikan operasi diizinkan dan path berada di dalam root; mengembalikan path yang dipakai"""
+    if operation not in allowed_operations:
+        raise JobForbiddenError(f"Operasi {operation} tidak diizinkan. Operasi yang diizinkan: "
+                                f"{sorted(allowed_operations)}")
+    if root is None:
+        return path
+    root = os.path.realpath(root)
+    resolved = os.path.realpath(os.path.join(root, path))
+    if os.path.commonpath([root, resolved]) != root:
+        raise JobForbiddenError(f"Path {path} berada di luar folder {root}")
+    return resolved
+
+
+def handle_job(pool: WorkerPool, job: Any, default_timeout: Optional[float] = None,
+               allowed_operations: Iterable[str] = READ_OPERATIONS, root: Optional[str] = None) -> Dict[str, Any]:
+    """Memproses satu job JSON (dict) dan selalu mengembalikan dict balasan"""
+    if not isinstance(job, dict) or 'path' not in job or 'operation' not in job:
+        return {'ok': False, 'error': "Job harus berupa object JSON dengan field path dan operation"}
+
+    reply = {'id': job.get('id')}
+    start = time.perf_counter()
+    try:
+        path = check_job(job['path'], job['operation'], allowed_operations, root)
+        reply['result'] = pool.run(path, job['operation'], job.get('kwargs') or {},
+                                   job.get('timeout', default_timeout))
+        reply['ok'] = True
+    except JobForbiddenError as e:
+        reply.update(ok=False, error=str(e), forbidden=True)
+    except ServerBusyError as e:
+        reply.update(ok=False, error=str(e), busy=True)
+    except TimeoutError as e:
+        reply.update(ok=False, error=str(e), timeout=True)
+    except Exception as e:
+        reply.update(ok=False, error=str(e))
+    reply['elapsed_s'] = time.perf_counter() - start
+    return reply
+
+
+class _HTTPHandler(BaseHTTPRequestHandler):
+    """POST /jobs menjalankan job, GET /health mengembalikan statistik pool"""
+
+    def _send(self, status: int, body: Dict[str, Any]):
+        payload = json.dumps(body, default=_json_default, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        if self.path != '/health':
+            self._send(404, {'ok': False, 'error': f"Path {self.path} tidak dikenal"})
+            return
+        self._send(200, {'ok': True, 'workers': self.server.pool.workers, 'stats': dict(self.server.pool.stats)})
+
+    def do_POST(self):
+        if self.path != '/jobs':
+            self._send(404, {'ok': False, 'error': f"Path {self.path} tidak dikenal"})
+            return
+        # Form HTML dan fetch "simple request" tidak bisa mengirim application/json tanpa preflight CORS
+        content_type = self.headers.get('Content-Type', '').split(';')[0].strip().lower()
+        if content_type != 'application/json':
+            self._send(415, {'ok': False, 'error': "Content-Type harus application/json"})
+            return
+        try:
+            job = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+        except ValueError as e:
+            self._send(400, {'ok': False, 'error': f"JSON tidak valid: {e}"})
+            return
+
+        reply = handle_job(self.server.pool, job, self.server.default_timeout,
+                           self.server.allowed_operations, self.server.root)
+        if reply['ok']:
+            status = 200
+        elif reply.get('forbidden'):
+            status = 403
+        elif reply.get('busy'):
+            status = 503
+        elif reply.get('timeout'):
+            status = 504
+        elif 'id' not in reply:
+            status = 400
+        else:
+            status = 500
+        self._send(status, reply)
+
+    def log_message(self, format, *args):
+        if self.server.pool.verbose:
+            super().log_message(format, *args)
+
+
+class _UnixHandler(socketserver.StreamRequestHandler):
+    """Setiap baris yang diterima adalah satu job JSON, dibalas satu baris JSON"""
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                reply = handle_job(self.server.pool, json.loads(line), self.server.default_timeout,
+                                   self.server.allowed_operations, self.server.root)
+            except ValueError as e:
+                reply = {'ok': False, 'error': f"JSON tidak valid: {e}"}
+            self.wfile.write(json.dumps(reply, default=_json_default, ensure_ascii=False).encode('utf-8') + b'\n')
+            self.wfile.flush()
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def create_server(pool: WorkerPool, host: str = '127.0.0.1', port: int = 8765,
+                  unix_socket: Optional[str] = None, default_timeout: Optional[float] = 60,
+                  allowed_operations: Optional[Iterable[str]] = None, root: Optional[str] = None):
+    """Membuat server HTTP (default, hanya localhost) atau Unix socket di atas pool worker
+
+    allowed_operations default-nya hanya operasi baca; root membatasi path job
+    ke satu folder (path relatif dihitung dari folder tersebut).
+    """
+    if unix_socket:
+        if os.path.exists(unix_socket):
+            os.remove(unix_socket)
+        server = _UnixServer(unix_socket, _UnixHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), _HTTPHandler)
+        server.daemon_threads = True
+    server.pool = pool
+    server.default_timeout = default_timeout
+    server.allowed_operations = frozenset(allowed_operations if allowed_operations is not None else READ_OPERATIONS)
+    server.root = root
+    return server
+
+
+def send_job(unix_socket: str, path: str, operation: str, timeout: Optional[float] = None,
+             **kwargs) -> Dict[str, Any]:
+    """Klien sederhana: mengirim satu job ke server Unix socket dan mengembalikan balasannya"""
+    job = {'path': path, 'operation': operation, 'kwargs': kwargs}
+    if timeout is not None:
+        job['timeout'] = timeout
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(unix_socket)
+        client.sendall(json.dumps(job).encode('utf-8') + b'\n')
+        with client.makefile('rb') as response:
+            return json.loads(response.readline())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Server DocumentProcessor dengan worker process hangat")
+    parser.add_argument('--host', default='127.0.0.1', help="alamat HTTP")
+    parser.add_argument('--port', type=int, default=8765, help="port HTTP")
+    parser.add_argument('--unix', help="path Unix socket (menggantikan HTTP)")
+    parser.add_argument('--workers', type=int, help="jumlah worker process (default jumlah CPU)")
+    parser.add_argument('--max-jobs', type=int, default=500, help="job per worker sebelum worker diganti")
+    parser.add_argument('--max-pending', type=int, help="batas job berjalan + menunggu (default workers x 4)")
+    parser.add_argument('--timeout', type=float, default=60, help="batas waktu default per job (detik)")
+    parser.add_argument('--root', help="hanya izinkan path di dalam folder ini")
+    parser.add_argument('--allow', help="daftar operasi yang diizinkan, dipisah koma (default hanya operasi baca)")
+    args = parser.parse_args()
+
+    allowed = [operation.strip() for operation in args.allow.split(',') if operation.strip()] if args.allow else None
+    pool = WorkerPool(args.workers, args.max_jobs, args.max_pending)
+    server = create_server(pool, args.host, args.port, args.unix, args.timeout, allowed, args.root)
+    address = args.unix or f"http://{args.host}:{args.port}"
+    print(f"✅ Server berjalan di {address} dengan {pool.workers} worker")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nServer dihentikan")
+    finally:
+        server.server_close()
+        pool.close()
+        if args.unix and os.path.exists(args.unix):
+            os.remove(args.unix)
+
+
+if __name__ == "__main__":
+    main()
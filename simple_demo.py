@@ -47,7 +47,7 @@ def simple_demo():
         # 4. Create a simple text version
         print(f"\n✅ EXPORT KE FORMAT LAIN:")
         txt_file = "testing_export.txt"
-        processor.process_document(txt_file, "write", content=content)
+        processor.convert(docx_file, txt_file)
         print(f"   Berhasil mengekspor ke: {txt_file}")
         
         # 5. File size comparison
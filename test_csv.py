@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Test round-trip file CSV: write -> read -> append dengan DocumentProcessor
+"""
+
+import os
+import tempfile
+
+from app import DocumentProcessor
+
+
+def test_csv_round_trip():
+    """Field berisi tanda kutip, koma dan spasi harus terbaca ulang apa adanya"""
+    processor = DocumentProcessor(verbose=False)
+    rows = [['id', 'quote'], ['1', 'he said "hi"'], ['2', 'a, b'], ['3', ' spasi di depan']]
+    new_row = ['4', 'x, "y"']
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_file = os.path.join(directory, "round_trip.csv")
+        processor.process_document(csv_file, "write", data=rows)
+        assert processor.process_document(csv_file, "read") == rows
+
+        processor.process_document(csv_file, "append", row_data=new_row)
+        assert processor.process_document(csv_file, "read") == rows + [new_row]
+
+
+def test_csv_semicolon_with_decimal_comma():
+    """File titik koma dengan angka desimal koma tidak boleh dipisah pada koma"""
+    processor = DocumentProcessor(verbose=False)
+    with tempfile.TemporaryDirectory() as directory:
+        csv_file = os.path.join(directory, "harga.csv")
+        with open(csv_file, 'w', encoding='utf-8') as file:
+            file.write("nama;harga;stok\nLaptop;10000,50;5\nMouse;50,5;3\n")
+        assert processor.process_document(csv_file, "read") == [
+            ['nama', 'harga', 'stok'], ['Laptop', '10000,50', '5'], ['Mouse', '50,5', '3']]
+
+
+def test_tsv_with_comma_in_field():
+    """TSV dengan koma di dalam field tetap dipisah pada tab"""
+    processor = DocumentProcessor(verbose=False)
+    with tempfile.TemporaryDirectory() as directory:
+        csv_file = os.path.join(directory, "data.csv")
+        with open(csv_file, 'w', encoding='utf-8') as file:
+            file.write("nama\tketerangan\nA\tmerah, besar\nB\tbiru\n")
+        assert processor.process_document(csv_file, "read") == [
+            ['nama', 'keterangan'], ['A', 'merah, besar'], ['B', 'biru']]
+
+
+if __name__ == "__main__":
+    test_csv_round_trip()
+    test_csv_semicolon_with_decimal_comma()
+    test_tsv_with_comma_in_field()
+    print("✅ Round-trip CSV berhasil")
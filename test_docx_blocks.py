@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Test pembacaan blok DOCX (iter_blocks) langsung dari XML di dalam zip
+"""
+
+import os
+import tempfile
+import types
+
+from docx import Document
+
+from app import DocumentProcessor
+
+
+def _make_docx(file_path: str):
+    document = Document()
+    document.sections[0].header.paragraphs[0].text = "Kop surat"
+    document.add_heading("Bab 1", level=1)
+    document.add_paragraph("Paragraf pertama")
+    table = document.add_table(rows=2, cols=2)
+    for row, values in zip(table.rows, (("a", "b"), ("c", "d"))):
+        for cell, value in zip(row.cells, values):
+            cell.text = value
+    document.add_paragraph("Paragraf kedua")
+    document.sections[0].footer.paragraphs[0].text = "Halaman kaki"
+    document.save(file_path)
+
+
+def test_iter_blocks_order_and_types():
+    """Header, isi (heading, paragraf, baris tabel) lalu footer, sesuai urutan baca"""
+    processor = DocumentProcessor(verbose=False)
+    with tempfile.TemporaryDirectory() as directory:
+        docx_file = os.path.join(directory, "blok.docx")
+        _make_docx(docx_file)
+
+        blocks = list(processor.process_document(docx_file, "iter_blocks"))
+        assert [(block['type'], block['text']) for block in blocks] == [
+            ('header', 'Kop surat'), ('heading', 'Bab 1'), ('paragraph', 'Paragraf pertama'),
+            ('table_row', 'a\tb'), ('table_row', 'c\td'), ('paragraph', 'Paragraf kedua'),
+            ('footer', 'Halaman kaki')]
+        assert blocks[1]['level'] == 1
+        assert blocks[4]['cells'] == ['c', 'd'] and blocks[4]['row'] == 1
+
+        rows = processor.process_document(docx_file, "iter_blocks", types=['table_row'])
+        assert [block['cells'] for block in rows] == [['a', 'b'], ['c', 'd']]
+
+
+def test_iter_blocks_limit():
+    """limit menghasilkan generator yang berhenti setelah n blok, juga bersama types"""
+    processor = DocumentProcessor(verbose=False)
+    with tempfile.TemporaryDirectory() as directory:
+        docx_file = os.path.join(directory, "blok.docx")
+        _make_docx(docx_file)
+
+        blocks = processor.process_document(docx_file, "iter_blocks", limit=2)
+        assert isinstance(blocks, types.GeneratorType)
+        assert [block['text'] for block in blocks] == ['Kop surat', 'Bab 1']
+
+        paragraphs = processor.process_document(docx_file, "iter_blocks", types=['paragraph'], limit=1)
+        assert [block['text'] for block in paragraphs] == ['Paragraf pertama']
+
+
+if __name__ == "__main__":
+    test_iter_blocks_order_and_types()
+    test_iter_blocks_limit()
+    print("✅ Blok DOCX berhasil")
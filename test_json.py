@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test query JSON dengan dot notation (pemindai mmap) pada DocumentProcessor
+"""
+
+import json
+import os
+import tempfile
+
+from app import DocumentProcessor
+
+DATA = {
+    "nama": "toko",
+    "alamat": {"kota": "Bandung", "kode_pos": "40111"},
+    "produk": [
+        {"id": 1, "nama": "Laptop", "tag": ["a", "b"]},
+        {"id": 2, "nama": "Mouse \"wireless\" {baru}", "tag": []},
+    ],
+    "kosong": {},
+}
+
+
+def _query(text: str, key: str, default=None):
+    processor = DocumentProcessor(verbose=False)
+    with tempfile.TemporaryDirectory() as directory:
+        json_file = os.path.join(directory, "data.json")
+        with open(json_file, 'w', encoding='utf-8') as file:
+            file.write(text)
+        return processor.process_document(json_file, "query", key=key, default=default)
+
+
+def _raises_value_error(text: str, key: str) -> bool:
+    try:
+        _query(text, key)
+    except ValueError:
+        return True
+    return False
+
+
+def test_nested_query():
+    """Key bersarang, indeks array dan string berisi kurung/kutip terbaca seperti json.load"""
+    text = json.dumps(DATA, indent=2)
+    assert _query(text, "alamat.kota") == "Bandung"
+    assert _query(text, "produk.1.nama") == 'Mouse "wireless" {baru}'
+    assert _query(text, "produk.0.tag.1") == "b"
+    assert _query(text, "produk") == DATA["produk"]
+    assert _query(text, "") == DATA
+
+
+def test_missing_key_returns_default():
+    """Key atau indeks yang tidak ada mengembalikan default"""
+    text = json.dumps(DATA)
+    assert _query(text, "alamat.negara", "-") == "-"
+    assert _query(text, "produk.5", "-") == "-"
+    assert _query(text, "kosong.a", "-") == "-"
+    assert _query(text, "nama.x", "-") == "-"
+
+
+def test_duplicate_key_uses_last_value():
+    """Key ganda mengikuti json.load: nilai terakhir yang dipakai"""
+    text = '{"a": 1, "b": {"c": 2}, "a": 3}'
+    assert _query(text, "a") == json.loads(text)["a"] == 3
+
+
+def test_malformed_json_raises():
+    """JSON terpotong atau rusak ditolak dengan ValueError, bukan default atau error lain"""
+    for text, key in [('{"a": 1', "a"), ('{"a" 1}', "a"), ('{"a": 1,}', "a"), ('{"a": [1, 2}', "a.0"),
+                      ('{"a": "tidak ditutup}', "a"), ('{"a": }', "a"), ('{"a": 1} sisa', "a")]:
+        assert _raises_value_error(text, key), text
+
+
+if __name__ == "__main__":
+    test_nested_query()
+    test_missing_key_returns_default()
+    test_duplicate_key_uses_last_value()
+    test_malformed_json_raises()
+    print("✅ Query JSON berhasil")
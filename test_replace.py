@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Test penggantian teks per potongan (chunk) pada file TXT dengan DocumentProcessor
+"""
+
+import os
+import re
+import tempfile
+
+from app import DocumentProcessor
+
+CONTENT = "halo dunia, halo semua. " * 20 + "aaaaaaaaab " * 10 + "selesai"
+
+
+def _replace(text: str, chunk_size: int, **kwargs) -> str:
+    processor = DocumentProcessor(verbose=False)
+    with tempfile.TemporaryDirectory() as directory:
+        txt_file = os.path.join(directory, "teks.txt")
+        with open(txt_file, 'w', encoding='utf-8', newline='') as file:
+            file.write(text)
+        processor.process_document(txt_file, "replace", chunk_size=chunk_size, **kwargs)
+        with open(txt_file, encoding='utf-8', newline='') as file:
+            return file.read()
+
+
+def test_literal_match_across_chunk_boundary():
+    """Teks yang terpotong di batas chunk tetap diganti, untuk setiap ukuran chunk"""
+    expected = CONTENT.replace("halo dunia", "hai bumi")
+    for chunk_size in range(1, 25):
+        assert _replace(CONTENT, chunk_size, old_text="halo dunia", new_text="hai bumi") == expected
+
+
+def test_multiple_literals_prefer_longest():
+    """Beberapa pola sekaligus: pola terpanjang menang walaupun melewati batas chunk"""
+    replacements = {"halo": "X", "halo semua": "Y"}
+    expected = CONTENT.replace("halo semua", "Y").replace("halo", "X")
+    for chunk_size in (3, 5, 8, 13):
+        assert _replace(CONTENT, chunk_size, replacements=replacements) == expected
+
+
+def test_regex_match_across_chunk_boundary():
+    """Match regex yang bisa memanjang melewati batas chunk diganti utuh"""
+    expected = re.sub(r"a+b", "<ab>", CONTENT)
+    for chunk_size in (2, 4, 7, 11, 64):
+        assert _replace(CONTENT, chunk_size, old_text=r"a+b", new_text="<ab>", regex=True,
+                        max_match_len=32) == expected
+
+
+if __name__ == "__main__":
+    test_literal_match_across_chunk_boundary()
+    test_multiple_literals_prefer_longest()
+    test_regex_match_across_chunk_boundary()
+    print("✅ Penggantian lintas chunk berhasil")
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Test query XML secara streaming (iterparse) dibandingkan dengan ElementTree
+"""
+
+import os
+import tempfile
+import xml.etree.ElementTree as ET
+
+from app import DocumentProcessor
+
+XML = ("<root><item><name>a</name><item><name>b</name><item><name>c</name></item></item></item>"
+       "<other><item>d</item></other><item><name>e</name></item></root>")
+
+
+def _query(xpath: str, limit=None):
+    processor = DocumentProcessor(verbose=False)
+    with tempfile.TemporaryDirectory() as directory:
+        xml_file = os.path.join(directory, "data.xml")
+        with open(xml_file, 'w', encoding='utf-8') as file:
+            file.write(XML)
+        return processor.process_document(xml_file, "query", xpath=xpath, limit=limit)
+
+
+def _expected(xpath: str):
+    return [ET.tostring(element, encoding='unicode') for element in ET.fromstring(XML).iterfind(xpath)]
+
+
+def test_nested_descendant_matches():
+    """Match .//tag yang bersarang tetap utuh dan urut sesuai dokumen seperti iterfind"""
+    for xpath in (".//item", ".//name", "item", "item/item", "item/item/item", "./other/item", "."):
+        assert _query(xpath) == _expected(xpath), xpath
+
+
+def test_query_limit():
+    """limit berhenti setelah n match pertama dalam urutan dokumen"""
+    assert _query(".//item", limit=2) == _expected(".//item")[:2]
+
+
+if __name__ == "__main__":
+    test_nested_descendant_matches()
+    test_query_limit()
+    print("✅ Query XML berhasil")
@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Pemrosesan inkremental folder masuk (watch folder) dengan journal SQLite
+
+Hanya file baru atau yang berubah yang diproses. Journal menyimpan path,
+ukuran, mtime, hash isi dan hasil operasi terakhir, sehingga restart (termasuk
+setelah crash) melanjutkan dari keadaan terakhir tanpa memproses ulang semuanya.
+
+Contoh:
+    python watcher.py /data/masuk --operation read --debounce 2
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import errno
+import hashlib
+import json
+import os
+import select
+import sqlite3
+import struct
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from app import DocumentProcessor
+
+# Konstanta event inotify (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+_WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+class _Inotify:
+    """Pembungkus minimal inotify Linux lewat ctypes, tanpa dependensi tambahan"""
+
+    def __init__(self):
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 gagal")
+        self._watches = {}
+
+    def add(self, directory: str):
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch gagal untuk {directory}")
+        self._watches[wd] = directory
+
+    def read(self, timeout: float) -> List[tuple]:
+        """Menunggu event hingga timeout detik, mengembalikan daftar (path, mask)"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        events = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+            directory = self._watches.get(wd)
+            if mask & IN_Q_OVERFLOW:
+                events.append((None, mask))
+            elif directory is not None:
+                events.append((os.path.join(directory, os.fsdecode(name)), mask))
+        return events
+
+    def close(self):
+        os.close(self.fd)
+
+
+class FolderWatcher:
+    """Memantau folder dan memproses file baru/berubah lewat DocumentProcessor
+
+    Perubahan dideteksi dengan inotify bila tersedia, selain itu dengan
+    polling setiap poll_interval detik. File baru diproses setelah ukuran dan
+    mtime-nya tidak berubah selama debounce detik, supaya file yang masih
+    ditulis tidak ikut terbaca. File yang hanya di-touch (hash isi sama)
+    tidak diproses ulang. Baris journal berstatus 'processing' dari run yang
+    terhenti diproses ulang saat start.
+    """
+
+    def __init__(self, directory: str, journal_path: Optional[str] = None,
+                 processor: Optional[DocumentProcessor] = None, operation: str = "read",
+                 kwargs: Optional[Dict[str, Any]] = None, debounce: float = 2.0,
+                 poll_interval: float = 5.0, recursive: bool = True, workers: int = 1,
+                 use_inotify: Optional[bool] = None, store_result: bool = True,
+                 on_result: Optional[Callable[[str, Any, Optional[str]], None]] = None):
+        self.directory = os.path.abspath(directory)
+        self.journal_path = journal_path or os.path.join(self.directory, '.watch_journal.db')
+        self.processor = processor or DocumentProcessor(verbose=False)
+        self.operation = operation
+        self.kwargs = kwargs or {}
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.recursive = recursive
+        self.workers = workers
+        self.store_result = store_result
+        self.on_result = on_result
+        self._pending = {}
+        self._inotify = None
+        if use_inotify is None:
+            use_inotify = sys.platform.startswith('linux')
+        if use_inotify:
+            try:
+                self._inotify = _Inotify()
+            except (OSError, AttributeError):
+                self._inotify = None
+        self.mode = 'inotify' if self._inotify is not None else 'polling'
+
+        # Watcher boleh dibuat di satu thread lalu dijalankan (run) di thread lain
+        self.conn = sqlite3.connect(self.journal_path, check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                content_hash TEXT,
+                status TEXT NOT NULL,
+                operation TEXT NOT NULL,
+                result TEXT,
+                error TEXT,
+                updated_at REAL NOT NULL
+            );
+        """)
+        # File yang sedang diproses saat run sebelumnya terhenti dianggap belum selesai
+        with self.conn:
+            self.conn.execute("UPDATE files SET status = 'pending' WHERE status = 'processing'")
+        self._known = {path: (size, mtime_ns) for path, size, mtime_ns in self.conn.execute(
+            "SELECT path, size, mtime_ns FROM files WHERE status IN ('done', 'failed') AND operation = ?",
+            (operation,))}
+
+    def close(self):
+        if self._inotify is not None:
+            self._inotify.close()
+        self.conn.close()
+
+    def __enter__(self) -> 'FolderWatcher':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def run(self, stop_event: Optional[threading.Event] = None):
+        """Memantau folder sampai stop_event di-set (atau KeyboardInterrupt)"""
+        stop_event = stop_event or threading.Event()
+        if self._inotify is not None:
+            for directory in self._directories():
+                if not self._watch(directory):
+                    break
+        self.scan()
+
+        while not stop_event.is_set():
+            # Selama ada file menunggu debounce, loop berputar lebih cepat
+            wait = min(self.poll_interval, self.debounce / 2) if self._pending else self.poll_interval
+            if self._inotify is not None:
+                self._handle_events(self._inotify.read(wait))
+            elif not stop_event.wait(wait):
+                self.scan()
+            self.process_ready()
+
+    def run_once(self) -> Dict[str, int]:
+        """Satu kali scan lalu memproses semua file yang berubah tanpa menunggu debounce"""
+        self.scan()
+        return self.process_ready(force=True)
+
+    def scan(self) -> int:
+        """Membandingkan isi folder dengan journal; mengembalikan jumlah file yang masuk antrean"""
+        seen = set()
+        queued = 0
+        for path in self._iter_files():
+            seen.add(path)
+            if self._note(path):
+                queued += 1
+        journal = {path for path, in self.conn.execute("SELECT path FROM files")}
+        self._forget(journal - seen)
+        return queued
+
+    def process_ready(self, force: bool = False) -> Dict[str, int]:
+        """Memproses file yang sudah stabil selama debounce detik"""
+        summary = {'processed': 0, 'skipped': 0, 'failed': 0}
+        now = time.monotonic()
+        ready = []
+        for path, (size, mtime_ns, since) in list(self._pending.items()):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                del self._pending[path]
+                continue
+            if (stat.st_size, stat.st_mtime_ns) != (size, mtime_ns):
+                self._pending[path] = (stat.st_size, stat.st_mtime_ns, now)
+            elif force or now - since >= self.debounce:
+                del self._pending[path]
+                ready.append((path, stat))
+
+        to_process = []
+        for path, stat in ready:
+            try:
+                content_hash = self._file_hash(path)
+            except FileNotFoundError:
+                # Dihapus setelah stat; event/scan berikutnya akan melepasnya dari journal
+                continue
+            row = self.conn.execute(
+                "SELECT content_hash, status, operation FROM files WHERE path = ?", (path,)).fetchone()
+            with self.conn:
+                if row and row[0] == content_hash and row[1] in ('done', 'failed') and row[2] == self.operation:
+                    # Isi tidak berubah (misalnya hanya di-touch), cukup perbarui metadata
+                    self.conn.execute("UPDATE files SET size = ?, mtime_ns = ?, updated_at = ? WHERE path = ?",
+                                      (stat.st_size, stat.st_mtime_ns, time.time(), path))
+                    self._known[path] = (stat.st_size, stat.st_mtime_ns)
+                    summary['skipped'] += 1
+                    continue
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO files (path, size, mtime_ns, content_hash, status, operation, updated_at) "
+                    "VALUES (?, ?, ?, ?, 'processing', ?, ?)",
+                    (path, stat.st_size, stat.st_mtime_ns, content_hash, self.operation, time.time()))
+            to_process.append((path, stat))
+
+        stats = dict(to_process)
+        for outcome in self._dispatch([path for path, _ in to_process]):
+            path = outcome['file_path']
+            self._record(path, stats[path], outcome['result'], outcome['error'])
+            summary['failed' if outcome['error'] else 'processed'] += 1
+        return summary
+
+    def _dispatch(self, paths: List[str]) -> Iterator[Dict[str, Any]]:
+        """Menjalankan operasi untuk setiap path; paralel lewat process_batch jika workers > 1"""
+        if self.workers > 1 and len(paths) > 1:
+            yield from self.processor.process_batch(paths, self.operation, workers=self.workers, **self.kwargs)
+            return
+        for path in paths:
+            try:
+                result = self.processor.process_document(path, self.operation, **self.kwargs)
+                if hasattr(result, '__next__'):
+                    result = list(result)
+                yield {'file_path': path, 'result': result, 'error': None}
+            except Exception as e:
+                yield {'file_path': path, 'result': None, 'error': f"{type(e).__name__}: {e}"}
+
+    def _record(self, path: str, stat: os.stat_result, result: Any, error: Optional[str]):
+        stored = None
+        if self.store_result and error is None:
+            stored = json.dumps(result, default=str, ensure_ascii=False)
+        with self.conn:
+            self.conn.execute("UPDATE files SET status = ?, result = ?, error = ?, updated_at = ? WHERE path = ?",
+                              ('failed' if error else 'done', stored, error, time.time(), path))
+        self._known[path] = (stat.st_size, stat.st_mtime_ns)
+        if self.on_result:
+            self.on_result(path, result, error)
+
+    def last_result(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """Mengambil status dan hasil terakhir sebuah file dari journal"""
+        row = self.conn.execute("SELECT status, operation, result, error, updated_at FROM files WHERE path = ?",
+                                (os.path.abspath(file_path),)).fetchone()
+        if row is None:
+            return None
+        return {'status': row[0], 'operation': row[1], 'result': json.loads(row[2]) if row[2] else None,
+                'error': row[3], 'updated_at': row[4]}
+
+    def _handle_events(self, events: List[tuple]):
+        for path, mask in events:
+            if path is None:
+                # Antrean event kernel penuh: ada event yang hilang, lakukan scan penuh
+                self.scan()
+            elif mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO) and self.recursive:
+                    if not self._watch(path):
+                        # Sudah beralih ke polling: scan penuh menggantikan sisa event
+                        self.scan()
+                        return
+                    for file_path in self._iter_files(path):
+                        self._note(file_path)
+            elif mask & (IN_DELETE | IN_MOVED_FROM):
+                self._pending.pop(path, None)
+                self._forget({path})
+            elif self._accepts(path):
+                self._note(path)
+
+    def _watch(self, directory: str) -> bool:
+        """Menambahkan watch inotify; jika gagal (misalnya batas watch habis) beralih ke polling"""
+        try:
+            self._inotify.add(directory)
+        except OSError as e:
+            if e.errno == errno.ENOENT:
+                # Folder sudah dihapus lagi sebelum sempat dipantau
+                return True
+            self._inotify.close()
+            self._inotify = None
+            self.mode = 'polling'
+            return False
+        return True
+
+    def _note(self, path: str) -> bool:
+        """Memasukkan file ke antrean debounce jika ukuran/mtime berbeda dari journal"""
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return False
+        current = (stat.st_size, stat.st_mtime_ns)
+        if self._known.get(path) == current:
+            return False
+        previous = self._pending.get(path)
+        if previous is None or previous[:2] != current:
+            self._pending[path] = (*current, time.monotonic())
+        return True
+
+    def _forget(self, paths: set):
+        """Menghapus file yang sudah tidak ada dari journal"""
+        if not paths:
+            return
+        with self.conn:
+            self.conn.executemany("DELETE FROM files WHERE path = ?", ((path,) for path in paths))
+        for path in paths:
+            self._known.pop(path, None)
+
+    def _accepts(self, path: str) -> bool:
+        name = os.path.basename(path)
+        if name.startswith('.') or name.endswith('~') or os.path.abspath(path) == self.journal_path:
+            return False
+        return os.path.splitext(name)[1].lower() in self.processor.supported_formats
+
+    def _directories(self) -> Iterator[str]:
+        yield self.directory
+        if self.recursive:
+            for root, directories, _ in os.walk(self.directory):
+                directories[:] = [name for name in directories if not name.startswith('.')]
+                for name in directories:
+                    yield os.path.join(root, name)
+
+    def _iter_files(self, directory: Optional[str] = None) -> Iterator[str]:
+        for root, directories, files in os.walk(directory or self.directory):
+            directories[:] = [name for name in directories if self.recursive and not name.startswith('.')]
+            for name in files:
+                path = os.path.join(root, name)
+                if self._accepts(path):
+                    yield path
+
+    def _file_hash(self, path: str) -> str:
+        digest = hashlib.sha1()
+        with open(path, 'rb') as file:
+            for block in iter(lambda: file.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memproses file baru/berubah di sebuah folder secara inkremental")
+    parser.add_argument('directory', help="folder yang dipantau")
+    parser.add_argument('--operation', default='read', help="operasi process_document untuk setiap file")
+    parser.add_argument('--journal', help="path journal SQLite (default <folder>/.watch_journal.db)")
+    parser.add_argument('--debounce', type=float, default=2.0, help="detik tanpa perubahan sebelum file diproses")
+    parser.add_argument('--poll-interval', type=float, default=5.0, help="interval polling jika inotify tidak tersedia")
+    parser.add_argument('--workers', type=int, default=1, help="jumlah worker paralel")
+    parser.add_argument('--polling', action='store_true', help="paksa polling walaupun inotify tersedia")
+    parser.add_argument('--once', action='store_true', help="scan dan proses sekali lalu keluar")
+    args = parser.parse_args()
+
+    def report(path, result, error):
+        print(f"❌ {path}: {error}" if error else f"✅ {path}")
+
+    watcher = FolderWatcher(args.directory, args.journal, operation=args.operation, debounce=args.debounce,
+                            poll_interval=args.poll_interval, workers=args.workers,
+                            use_inotify=False if args.polling else None, on_result=report)
+    try:
+        if args.once:
+            print(f"Ringkasan: {watcher.run_once()}")
+        else:
+            print(f"Memantau {watcher.directory} ({watcher.mode}), tekan Ctrl+C untuk berhenti")
+            watcher.run()
+    except KeyboardInterrupt:
+        print("\nPemantauan dihentikan")
+    finally:
+        watcher.close()
+
+
+if __name__ == "__main__":
+    main()